@@ -7,12 +7,42 @@ from core.models import Tile, Page
 logger = logging.getLogger(__name__)
 
 
+def _build_rect_masks(rows: int, cols: int) -> Dict[Tuple[int, int, int, int], int]:
+    """Precompute the occupancy bitmask of every rectangle that fits the grid.
+    
+    Cells map to bits row-major (bit ``row * cols + col``), so an 8×8 grid
+    fits in 64 bits and overlap tests become a single AND.
+    
+    Args:
+        rows: Number of grid rows.
+        cols: Number of grid columns.
+    
+    Returns:
+        Dictionary mapping (row, col, width, height) to its cell bitmask.
+    """
+    masks = {}
+    for height in range(1, rows + 1):
+        for width in range(1, cols + 1):
+            row_bits = (1 << width) - 1
+            for row in range(rows - height + 1):
+                for col in range(cols - width + 1):
+                    mask = 0
+                    for r in range(row, row + height):
+                        mask |= row_bits << (r * cols + col)
+                    masks[(row, col, width, height)] = mask
+    return masks
+
+
 class GridController:
     """Controller for 8×8 grid layout with collision detection and multi-page support."""
     
     GRID_ROWS = 8
     GRID_COLS = 8
     
+    # Cell bitmask for every in-grid (row, col, width, height)
+    _RECT_MASKS = _build_rect_masks(GRID_ROWS, GRID_COLS)
+    _GRID_MASK = (1 << (GRID_ROWS * GRID_COLS)) - 1
+    
     def __init__(self) -> None:
         """Initialize grid controller."""
         self.pages: List[Page] = []
@@ -58,27 +88,25 @@ class GridController:
         Returns:
             Tuple of (row, col) for first available space, or None if no space.
         """
-        tiles = self.tiles
-        
-        for row in range(self.GRID_ROWS - height + 1):
-            for col in range(self.GRID_COLS - width + 1):
-                # Check if this area is free
-                is_free = True
-                for r in range(row, row + height):
-                    for c in range(col, col + width):
-                        # Check if any tile occupies this cell
-                        for tile in tiles:
-                            if (tile.row <= r < tile.row + tile.height and
-                                tile.col <= c < tile.col + tile.width):
-                                is_free = False
-                                break
-                        if not is_free:
-                            break
-                    if not is_free:
-                        break
-                
-                if is_free:
-                    return (row, col)
+        if not (1 <= width <= self.GRID_COLS and 1 <= height <= self.GRID_ROWS):
+            return None
+        
+        occupied = self._occupancy(exclude_id=None)
+        masks = self._RECT_MASKS
+        last_row = self.GRID_ROWS - height
+        
+        # Only free cells can anchor a tile; visit them lowest bit first,
+        # which is the same row-major order as a full scan
+        free = ~occupied & self._GRID_MASK
+        while free:
+            low = free & -free
+            row, col = divmod(low.bit_length() - 1, self.GRID_COLS)
+            if row > last_row:
+                break
+            mask = masks.get((row, col, width, height))
+            if mask is not None and not occupied & mask:
+                return (row, col)
+            free ^= low
         
         return None
     
@@ -158,28 +186,13 @@ class GridController:
         if not tile:
             return False
         
-        # Check bounds
-        if new_row < 0 or new_col < 0:
-            return False
-        if new_row + tile.height > self.GRID_ROWS:
+        # Check bounds and collision before touching the tile
+        if not self.can_place(new_row, new_col, tile.width, tile.height, exclude_id=tile_id):
             return False
-        if new_col + tile.width > self.GRID_COLS:
-            return False
-        
-        # Save old position
-        old_row, old_col = tile.row, tile.col
         
-        # Try new position
         tile.row = new_row
         tile.col = new_col
         
-        # Check collision
-        if self.check_collision(tile, exclude_id=tile_id):
-            # Collision - revert
-            tile.row = old_row
-            tile.col = old_col
-            return False
-        
         logger.debug(f"Moved tile {tile_id} to ({new_row}, {new_col})")
         return True
     
@@ -207,35 +220,39 @@ class GridController:
         if not tile:
             return False
         
-        # Validate size
-        if new_width < 1 or new_height < 1:
-            return False
-        if new_width > self.GRID_COLS or new_height > self.GRID_ROWS:
-            return False
-        
-        # Check bounds
-        if tile.row + new_height > self.GRID_ROWS:
-            return False
-        if tile.col + new_width > self.GRID_COLS:
+        # Check size, bounds and collision before touching the tile
+        if not self.can_place(tile.row, tile.col, new_width, new_height, exclude_id=tile_id):
             return False
         
-        # Save old size
-        old_width, old_height = tile.width, tile.height
-        
-        # Try new size
         tile.width = new_width
         tile.height = new_height
         
-        # Check collision
-        if self.check_collision(tile, exclude_id=tile_id):
-            # Collision - revert
-            tile.width = old_width
-            tile.height = old_height
-            return False
-        
         logger.debug(f"Resized tile {tile_id} to {new_width}×{new_height}")
         return True
     
+    def can_place(
+        self, row: int, col: int, width: int, height: int,
+        exclude_id: Optional[int] = None
+    ) -> bool:
+        """Check whether a rectangle fits the grid and is free on the current page.
+        
+        Cheap enough to call on every drag step, and nothing is modified.
+        
+        Args:
+            row: Top row.
+            col: Left column.
+            width: Width in grid cells.
+            height: Height in grid cells.
+            exclude_id: ID of tile to ignore (usually the tile being moved).
+        
+        Returns:
+            True if the rectangle is inside the grid and overlaps no tile.
+        """
+        mask = self._RECT_MASKS.get((row, col, width, height))
+        if mask is None:
+            return False
+        return not self._occupancy(exclude_id) & mask
+    
     def check_collision(self, tile: Tile, exclude_id: Optional[int]) -> bool:
         """Check if a tile would collide with other tiles.
         
@@ -246,16 +263,27 @@ class GridController:
         Returns:
             True if collision detected, False otherwise.
         """
-        for other in self.tiles:
-            # Skip self
-            if other.id == exclude_id:
-                continue
-            
-            # Check overlap
-            if tile.overlaps_with(other):
-                return True
+        mask = self._RECT_MASKS[tile.row, tile.col, tile.width, tile.height]
+        return bool(self._occupancy(exclude_id) & mask)
+    
+    def _occupancy(self, exclude_id: Optional[int]) -> int:
+        """Get the cell bitmask of all tiles on the current page.
         
-        return False
+        Built on demand because MainWindow assigns and edits
+        ``tiles_by_page`` lists directly.
+        
+        Args:
+            exclude_id: ID of tile to leave out.
+        
+        Returns:
+            Bitmask with one bit set per occupied cell.
+        """
+        masks = self._RECT_MASKS
+        occupied = 0
+        for other in self.tiles:
+            if other.id != exclude_id:
+                occupied |= masks[other.row, other.col, other.width, other.height]
+        return occupied
     
     def snap_to_grid(self, row: int, col: int, width: int, height: int) -> Tuple[int, int]:
         """Snap a position to grid boundaries.
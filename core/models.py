@@ -5,7 +5,7 @@ from typing import Optional, Dict, Any
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """Represents a dashboard page."""
     
@@ -17,7 +17,7 @@ class Page:
         return f"Page(id={self.id}, name='{self.name}', index={self.index_order})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     """Represents a widget tile on a page."""
     
@@ -65,11 +65,12 @@ class Tile:
         Returns:
             True if tiles overlap, False otherwise.
         """
-        r1, c1, r2, c2 = self.bounds
-        or1, oc1, or2, oc2 = other.bounds
-        
-        # Check if rectangles overlap
-        return not (r2 <= or1 or r1 >= or2 or c2 <= oc1 or c1 >= oc2)
+        # Compare fields directly; going through ``bounds`` would build
+        # two tuples per call in the grid's pairwise collision scans
+        row, col = self.row, self.col
+        other_row, other_col = other.row, other.col
+        return (row < other_row + other.height and other_row < row + self.height and
+                col < other_col + other.width and other_col < col + self.width)
     
     def contains_cell(self, row: int, col: int) -> bool:
         """Check if tile contains a specific cell.
@@ -81,8 +82,9 @@ class Tile:
         Returns:
             True if cell is within tile bounds.
         """
-        return (self.row <= row < self.row + self.height and
-                self.col <= col < self.col + self.width)
+        top = self.row
+        left = self.col
+        return top <= row < top + self.height and left <= col < left + self.width
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert tile to dictionary for storage.
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Type
 from core.plugin_api import WidgetPlugin, PluginMetadata, ExecutionMode
 from core.manifest_parser import ManifestParser
-from core.plugin_proxy import PluginProxy
+from core.plugin_proxy import PluginProxy, shutdown_fetch_pool
 from plugins_host.supervisor import PluginSupervisor
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ class PluginLoader:
         self._metadata: Dict[str, PluginMetadata] = {}
         self._classes: Dict[str, Type[WidgetPlugin]] = {}
         self._instances: Dict[str, WidgetPlugin] = {}  # instance_id -> plugin
-        self._supervisor = PluginSupervisor(base_port=5555)
+        self._supervisor = PluginSupervisor(base_port=5555, pool_size=2)
     
     def discover_plugins(self) -> List[PluginMetadata]:
         """Discover all plugins in the plugins directory.
@@ -289,6 +289,9 @@ class PluginLoader:
         """Shutdown all plugins and clean up resources."""
         logger.info("Shutting down plugin loader")
         
+        # Drop pending render fetches so none outlives its worker
+        shutdown_fetch_pool()
+        
         # Dispose all instances
         for instance_id in list(self._instances.keys()):
             self.dispose_instance(instance_id)
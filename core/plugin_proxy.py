@@ -5,6 +5,9 @@ but delegates all operations to an out-of-process plugin via IPC.
 """
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from pathlib import Path
 
@@ -13,6 +16,21 @@ from plugins_host.supervisor import PluginSupervisor
 
 logger = logging.getLogger(__name__)
 
+# Shared by all proxies for first-render fetches off the UI thread
+_FETCH_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix="plugin-render"
+)
+
+
+def shutdown_fetch_pool() -> None:
+    """Cancel queued render fetches and stop the fetch threads.
+    
+    A fetch already waiting on its worker still finishes, but its result
+    is dropped once the proxy has been disposed.
+    """
+    _FETCH_POOL.shutdown(wait=False, cancel_futures=True)
+
 
 class PluginProxy(WidgetPlugin):
     """Proxy for out-of-process plugins using IPC.
@@ -44,6 +62,12 @@ class PluginProxy(WidgetPlugin):
         self.supervisor = supervisor
         self.worker_script = worker_script
         self._initialized = False
+        self._render_data: Optional[Dict[str, Any]] = None  # Last render from TICK
+        
+        # Serializes roundtrips on this instance's socket, which may be used
+        # from a fetch thread as well as the UI thread
+        self._io_lock = threading.Lock()
+        self._fetch_pending = False
     
     def init(self) -> None:
         """Initialize the plugin (spawn worker process)."""
@@ -58,7 +82,9 @@ class PluginProxy(WidgetPlugin):
             instance_id=self.instance_id,
             plugin_id=self.plugin_id,
             worker_script=self.worker_script,
-            settings=self.settings
+            settings=self.settings,
+            module_path=self.metadata.module_path,
+            class_name=self.metadata.class_name
         )
         
         if not success:
@@ -84,8 +110,29 @@ class PluginProxy(WidgetPlugin):
         if not self._initialized:
             return
         
-        # Send update message to worker
-        self.supervisor.send_update(self.instance_id, delta_time)
+        # Skip this tick rather than block while a fetch is in flight
+        if not self._io_lock.acquire(blocking=False):
+            return
+        
+        # Update and render in a single roundtrip
+        try:
+            response = self.supervisor.tick(
+                instance_id=self.instance_id,
+                delta_time=delta_time,
+                width=400,
+                height=300
+            )
+        finally:
+            self._io_lock.release()
+        
+        # Unchanged output: keep the last render and skip the repaint
+        if response is None or response.get("status") == "not_modified":
+            return
+        
+        render_data = response.get("render_data", {})
+        if render_data != self._render_data:
+            self._render_data = render_data
+            self.render_updated.emit()
     
     def get_render_data(self) -> Dict[str, Any]:
         """Get render data from plugin.
@@ -96,12 +143,17 @@ class PluginProxy(WidgetPlugin):
         if not self._initialized:
             return {"html": "<div>Plugin not initialized</div>"}
         
+        # Reuse output delivered with the last TICK
+        if self._render_data is not None:
+            return self._render_data
+        
         # Request render from worker (using fixed size for now)
-        render_data = self.supervisor.request_render(
-            instance_id=self.instance_id,
-            width=400,
-            height=300
-        )
+        with self._io_lock:
+            render_data = self.supervisor.request_render(
+                instance_id=self.instance_id,
+                width=400,
+                height=300
+            )
         
         if render_data is None:
             logger.warning(f"Failed to get render data from {self.instance_id}")
@@ -109,6 +161,56 @@ class PluginProxy(WidgetPlugin):
         
         return render_data.get("render_data", {})
     
+    def has_render_data(self) -> bool:
+        """Check whether render data can be returned without a roundtrip.
+        
+        Returns:
+            True if get_render_data() will not block on the worker
+        """
+        return self._render_data is not None or not self._initialized
+    
+    def fetch_render_data_async(self) -> None:
+        """Fetch render data on a background thread.
+        
+        render_updated is emitted once the data has arrived; Qt delivers it
+        to receivers on the UI thread. Does nothing if a fetch is already
+        pending.
+        """
+        if self._fetch_pending or not self._initialized:
+            return
+        
+        self._fetch_pending = True
+        _FETCH_POOL.submit(self._fetch_render_data)
+    
+    def _fetch_render_data(self) -> None:
+        """Fetch render data from the worker and announce it (runs off the UI thread)."""
+        try:
+            with self._io_lock:
+                if not self._initialized:
+                    return
+                render_data = self.supervisor.request_render(
+                    instance_id=self.instance_id,
+                    width=400,
+                    height=300
+                )
+        except Exception as e:
+            logger.error(f"Error fetching render data from {self.instance_id}: {e}")
+            render_data = None
+        finally:
+            self._fetch_pending = False
+        
+        # Disposed while the request was in flight; nobody is listening
+        if not self._initialized:
+            return
+        
+        # On failure nothing is cached, so the next get_render_data() retries
+        if render_data is None:
+            logger.warning(f"Failed to get render data from {self.instance_id}")
+        else:
+            self._render_data = render_data.get("render_data", {})
+        
+        self.render_updated.emit()
+    
     def on_settings_changed(self, new_settings: Dict[str, Any]) -> None:
         """Handle settings change.
         
@@ -119,9 +221,11 @@ class PluginProxy(WidgetPlugin):
             return
         
         self.settings = new_settings
+        self._render_data = None
         
         # Send settings update to worker
-        success = self.supervisor.update_settings(self.instance_id, new_settings)
+        with self._io_lock:
+            success = self.supervisor.update_settings(self.instance_id, new_settings)
         
         if not success:
             logger.warning(f"Failed to update settings for {self.instance_id}")
@@ -134,6 +238,6 @@ class PluginProxy(WidgetPlugin):
         logger.info(f"Disposing plugin proxy: {self.instance_id}")
         
         # Terminate worker process
-        self.supervisor.terminate_plugin(self.instance_id)
-        
-        self._initialized = False
+        with self._io_lock:
+            self.supervisor.terminate_plugin(self.instance_id)
+            self._initialized = False
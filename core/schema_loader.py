@@ -2,13 +2,40 @@
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-from jsonschema import validate, ValidationError, Draft7Validator
+from typing import Dict, Any, Optional, Tuple
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _read_schema(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Read and check a schema file.
+    
+    Cached across SchemaLoader instances; the modification time is part
+    of the key, so an edited file is read again.
+    
+    Args:
+        path: Path to schema file.
+        mtime_ns: File modification time in nanoseconds.
+    
+    Returns:
+        Parsed schema dictionary.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    
+    # Validate the schema itself
+    Draft7Validator.check_schema(schema)
+    
+    logger.info("Loaded schema: %s", Path(path).name)
+    return schema
+
+
 class SchemaLoader:
     """Loads and validates JSON schemas for widget settings."""
     
@@ -23,10 +50,17 @@ class SchemaLoader:
         
         self.schema_dir = schema_dir
         self.schema_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Compiled validators by schema identity; the schema is kept alive
+        # alongside its validator so the id cannot be reused
+        self._validator_cache: Dict[int, Tuple[Dict[str, Any], Any]] = {}
     
     def load_schema(self, schema_path: Path) -> Dict[str, Any]:
         """Load a JSON schema from file.
         
+        The returned dictionary is shared between callers and must not be
+        modified.
+        
         Args:
             schema_path: Path to schema file.
         
@@ -37,23 +71,14 @@ class SchemaLoader:
             FileNotFoundError: If schema file doesn't exist.
             json.JSONDecodeError: If schema is invalid JSON.
         """
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
+        try:
+            mtime_ns = schema_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Schema file not found: {schema_path}") from None
         
-        # Check cache
         cache_key = str(schema_path)
-        if cache_key in self.schema_cache:
-            return self.schema_cache[cache_key]
-        
-        with open(schema_path, "r", encoding="utf-8") as f:
-            schema = json.load(f)
-        
-        # Validate the schema itself
-        Draft7Validator.check_schema(schema)
-        
-        # Cache it
+        schema = _read_schema(cache_key, mtime_ns)
         self.schema_cache[cache_key] = schema
-        logger.info("Loaded schema: %s", schema_path.name)
         
         return schema
     
@@ -82,13 +107,36 @@ class SchemaLoader:
         Returns:
             Tuple of (is_valid, error_message).
         """
-        try:
-            validate(instance=data, schema=schema)
+        error = best_match(self._get_validator(schema).iter_errors(data))
+        if error is None:
             return (True, None)
-        except ValidationError as e:
-            error_msg = f"Validation error at {'.'.join(str(p) for p in e.path)}: {e.message}"
-            logger.warning("Schema validation failed: %s", error_msg)
-            return (False, error_msg)
+        
+        error_msg = f"Validation error at {'.'.join(str(p) for p in error.path)}: {error.message}"
+        logger.warning("Schema validation failed: %s", error_msg)
+        return (False, error_msg)
+    
+    def _get_validator(self, schema: Dict[str, Any]) -> Any:
+        """Get the compiled validator for a schema, creating it on first use.
+        
+        Args:
+            schema: JSON schema.
+        
+        Returns:
+            Validator instance for the schema's draft.
+        
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        cached = self._validator_cache.get(id(schema))
+        if cached is not None:
+            return cached[1]
+        
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        
+        self._validator_cache[id(schema)] = (schema, validator)
+        return validator
     
     def get_default_values(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Extract default values from a schema.
@@ -1,6 +1,6 @@
 """Links widget plugin implementation."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from core.plugin_api import WidgetPlugin, PluginMetadata  # Changed from PluginBase
 
 
@@ -16,6 +16,8 @@ class LinksPlugin(WidgetPlugin):  # Changed from PluginBase
     ):
         """Initialize the links plugin."""
         super().__init__(instance_id, plugin_id, metadata, settings)
+        # Render output only depends on settings, so it is built once per change
+        self._render_cache: Optional[Dict[str, Any]] = None
     
     def init(self) -> None:
         """Initialize the plugin."""
@@ -37,6 +39,16 @@ class LinksPlugin(WidgetPlugin):  # Changed from PluginBase
     def get_render_data(self) -> Dict[str, Any]:
         """Get render data for this plugin.
         
+        Returns:
+            Dictionary containing HTML to display
+        """
+        if self._render_cache is None:
+            self._render_cache = self._build_render_data()
+        return self._render_cache
+    
+    def _build_render_data(self) -> Dict[str, Any]:
+        """Build render data from the current settings.
+        
         Returns:
             Dictionary containing HTML to display
         """
@@ -105,8 +117,9 @@ class LinksPlugin(WidgetPlugin):  # Changed from PluginBase
         Args:
             new_settings: New settings dictionary
         """
+        # Drop cached output before the re-render is triggered
+        self._render_cache = None
         super().on_settings_changed(new_settings)
-        # Links updated, trigger re-render
     
     def dispose(self) -> None:
         """Dispose of the plugin and clean up resources."""
@@ -8,6 +8,7 @@ from .message_schema import (
     UpdateMessage,
     DisposeMessage,
     RenderMessage,
+    TickMessage,
     ErrorMessage,
     SettingsChangedMessage,
 )
@@ -21,6 +22,7 @@ __all__ = [
     "UpdateMessage",
     "DisposeMessage",
     "RenderMessage",
+    "TickMessage",
     "ErrorMessage",
     "SettingsChangedMessage",
     "ZMQTransport",
@@ -4,24 +4,28 @@ This module defines the message schema for communication between
 the host application and plugin worker processes.
 """
 
-from enum import Enum
+from enum import IntEnum
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, asdict
 import json
 
 
-class MessageType(str, Enum):
-    """Message types for IPC communication."""
+class MessageType(IntEnum):
+    """Message types for IPC communication.
     
-    INIT = "init"                    # Initialize plugin
-    START = "start"                  # Start plugin lifecycle
-    UPDATE = "update"                # Update plugin state
-    DISPOSE = "dispose"              # Dispose plugin resources
-    RENDER = "render"                # Request render output
-    SETTINGS_CHANGED = "settings_changed"  # Settings updated
-    ERROR = "error"                  # Error occurred
-    HEARTBEAT = "heartbeat"          # Process health check
-    SHUTDOWN = "shutdown"            # Graceful shutdown
+    Values are small ints so they hash, compare and serialize cheaply.
+    """
+    
+    INIT = 1                         # Initialize plugin
+    START = 2                        # Start plugin lifecycle
+    UPDATE = 3                       # Update plugin state
+    DISPOSE = 4                      # Dispose plugin resources
+    RENDER = 5                       # Request render output
+    TICK = 6                         # Update + render in one roundtrip
+    SETTINGS_CHANGED = 7             # Settings updated
+    ERROR = 8                        # Error occurred
+    HEARTBEAT = 9                    # Process health check
+    SHUTDOWN = 10                    # Graceful shutdown
 
 
 @dataclass
@@ -41,6 +45,10 @@ class IPCMessage:
         }
         return json.dumps(data)
     
+    def to_bytes(self) -> bytes:
+        """Serialize message to UTF-8 encoded JSON bytes."""
+        return self.to_json().encode("utf-8")
+    
     @classmethod
     def from_json(cls, json_str: str) -> "IPCMessage":
         """Deserialize message from JSON."""
@@ -56,14 +64,27 @@ class IPCMessage:
 class InitMessage(IPCMessage):
     """Initialize plugin message."""
     
-    def __init__(self, instance_id: str, plugin_id: str, settings: Dict[str, Any]):
+    def __init__(
+        self,
+        instance_id: str,
+        plugin_id: str,
+        settings: Dict[str, Any],
+        module_path: Optional[str] = None,
+        class_name: Optional[str] = None
+    ):
+        payload = {
+            "plugin_id": plugin_id,
+            "settings": settings,
+        }
+        # Generic (pooled) workers load the plugin class from these
+        if module_path and class_name:
+            payload["module_path"] = module_path
+            payload["class_name"] = class_name
+        
         super().__init__(
             type=MessageType.INIT,
             instance_id=instance_id,
-            payload={
-                "plugin_id": plugin_id,
-                "settings": settings,
-            }
+            payload=payload
         )
 
 
@@ -115,6 +136,18 @@ class RenderMessage(IPCMessage):
         )
 
 
+@dataclass
+class TickMessage(IPCMessage):
+    """Update plugin state and request render output in one message."""
+    
+    def __init__(self, instance_id: str, delta_time: float, width: int, height: int):
+        super().__init__(
+            type=MessageType.TICK,
+            instance_id=instance_id,
+            payload={"delta_time": delta_time, "width": width, "height": height},
+        )
+
+
 @dataclass
 class SettingsChangedMessage(IPCMessage):
     """Settings updated message."""
@@ -5,7 +5,7 @@ This module provides the low-level transport using ZeroMQ sockets.
 
 import logging
 import zmq
-from typing import Optional, Callable
+from typing import Dict, Optional, Callable
 from .message_schema import IPCMessage
 
 logger = logging.getLogger(__name__)
@@ -14,25 +14,38 @@ logger = logging.getLogger(__name__)
 class ZMQTransport:
     """ZeroMQ transport for sending/receiving IPC messages."""
     
-    def __init__(self, socket_type: int, endpoint: str, bind: bool = False):
+    def __init__(
+        self,
+        socket_type: int,
+        endpoint: str,
+        bind: bool = False,
+        socket_options: Optional[Dict[int, int]] = None
+    ):
         """Initialize ZMQ transport.
         
         Args:
             socket_type: ZMQ socket type (REQ, REP, DEALER, ROUTER, etc.)
             endpoint: ZMQ endpoint (e.g., "tcp://127.0.0.1:5555" or "ipc:///tmp/plugin.ipc")
             bind: If True, bind to endpoint; if False, connect to endpoint
+            socket_options: Socket options applied before bind/connect
         """
         self.context = zmq.Context()
         self.socket = self.context.socket(socket_type)
+        for option, value in (socket_options or {}).items():
+            self.socket.setsockopt(option, value)
         self.endpoint = endpoint
         self.is_bound = bind
         
+        # Last applied socket timeouts (avoids a setsockopt per message)
+        self._sndtimeo: Optional[int] = None
+        self._rcvtimeo: Optional[int] = None
+        
         if bind:
             self.socket.bind(endpoint)
-            logger.info(f"ZMQ socket bound to {endpoint}")
+            logger.info("ZMQ socket bound to %s", endpoint)
         else:
             self.socket.connect(endpoint)
-            logger.info(f"ZMQ socket connected to {endpoint}")
+            logger.info("ZMQ socket connected to %s", endpoint)
     
     def send(self, message: IPCMessage, timeout_ms: int = 5000) -> bool:
         """Send a message.
@@ -45,16 +58,17 @@ class ZMQTransport:
             True if sent successfully, False on timeout
         """
         try:
-            self.socket.setsockopt(zmq.SNDTIMEO, timeout_ms)
+            self._set_send_timeout(timeout_ms)
             json_str = message.to_json()
             self.socket.send_string(json_str)
-            logger.debug(f"Sent {message.type} message for instance {message.instance_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent %s message for instance %s", message.type.name, message.instance_id)
             return True
         except zmq.Again:
-            logger.warning(f"Send timeout for {message.type} message")
+            logger.warning("Send timeout for %s message", message.type.name)
             return False
         except Exception as e:
-            logger.error(f"Error sending message: {e}")
+            logger.error("Error sending message: %s", e)
             return False
     
     def receive(self, timeout_ms: int = 5000) -> Optional[IPCMessage]:
@@ -67,18 +81,31 @@ class ZMQTransport:
             Received message, or None on timeout
         """
         try:
-            self.socket.setsockopt(zmq.RCVTIMEO, timeout_ms)
+            self._set_receive_timeout(timeout_ms)
             json_str = self.socket.recv_string()
             message = IPCMessage.from_json(json_str)
-            logger.debug(f"Received {message.type} message for instance {message.instance_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received %s message for instance %s", message.type.name, message.instance_id)
             return message
         except zmq.Again:
             logger.debug("Receive timeout")
             return None
         except Exception as e:
-            logger.error(f"Error receiving message: {e}")
+            logger.error("Error receiving message: %s", e)
             return None
     
+    def _set_send_timeout(self, timeout_ms: int) -> None:
+        """Apply the send timeout, skipping the syscall if unchanged."""
+        if timeout_ms != self._sndtimeo:
+            self.socket.setsockopt(zmq.SNDTIMEO, timeout_ms)
+            self._sndtimeo = timeout_ms
+    
+    def _set_receive_timeout(self, timeout_ms: int) -> None:
+        """Apply the receive timeout, skipping the syscall if unchanged."""
+        if timeout_ms != self._rcvtimeo:
+            self.socket.setsockopt(zmq.RCVTIMEO, timeout_ms)
+            self._rcvtimeo = timeout_ms
+    
     def send_and_receive(self, message: IPCMessage, timeout_ms: int = 5000) -> Optional[IPCMessage]:
         """Send a message and wait for a response (REQ/REP pattern).
         
@@ -95,7 +122,7 @@ class ZMQTransport:
     
     def close(self) -> None:
         """Close the transport."""
-        logger.info(f"Closing ZMQ transport for {self.endpoint}")
+        logger.info("Closing ZMQ transport for %s", self.endpoint)
         self.socket.close()
         self.context.term()
     
@@ -2,5 +2,6 @@
 
 from .supervisor import PluginSupervisor
 from .worker import PluginWorker
+from .worker_pool import WorkerPool
 
-__all__ = ["PluginSupervisor", "PluginWorker"]
+__all__ = ["PluginSupervisor", "PluginWorker", "WorkerPool"]
@@ -6,103 +6,210 @@ This module manages the lifecycle of plugin worker processes.
 import logging
 import subprocess
 import sys
+import threading
 import time
 import zmq
+from array import array
 from pathlib import Path
-from typing import Dict, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
 
 from ipc.message_schema import (
     IPCMessage, InitMessage, StartMessage, UpdateMessage,
-    DisposeMessage, RenderMessage, SettingsChangedMessage,
+    DisposeMessage, RenderMessage, TickMessage, SettingsChangedMessage,
     ShutdownMessage, MessageType
 )
 from ipc.zmq_transport import ZMQTransport
+from plugins_host.worker_pool import WorkerPool, is_generic_worker
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class PluginProcess:
-    """Information about a running plugin process."""
-    
-    instance_id: str
-    plugin_id: str
-    process: subprocess.Popen
-    transport: ZMQTransport
-    endpoint: str
-    started: float
-    last_heartbeat: float
-
-
 class PluginSupervisor:
     """Manages out-of-process plugin worker processes."""
     
-    def __init__(self, base_port: int = 5555):
+    # Worker startup handshake
+    STARTUP_TIMEOUT_S = 5.0
+    CONNECT_RETRY_MS = 5
+    
+    def __init__(self, base_port: int = 5555, pool_size: int = 0):
         """Initialize plugin supervisor.
         
         Args:
             base_port: Base port number for ZMQ endpoints
+            pool_size: Number of generic workers to keep pre-started once a
+                pooled spawn is requested (0 disables pooling)
         """
         self.base_port = base_port
-        self.processes: Dict[str, PluginProcess] = {}
         self._next_port = base_port
+        
+        # Process table, stored column-wise; _index maps instance_id -> row
+        self._index: Dict[str, int] = {}
+        self._instance_ids: List[str] = []
+        self._plugin_ids: List[str] = []
+        self._processes: List[subprocess.Popen] = []
+        self._polls: List[Callable[[], Optional[int]]] = []
+        self._transports: List[ZMQTransport] = []
+        self._endpoints: List[str] = []
+        self._started = array('d')
+        self._last_hb = array('d')
+        self._last_render: List[Optional[Dict]] = []
+        
+        # Guards row changes against lookups from render-fetch threads
+        self._table_lock = threading.Lock()
+        self._pool: Optional[WorkerPool] = None
+        
+        if pool_size > 0:
+            self._pool = WorkerPool(pool_size, self._allocate_endpoint)
+    
+    def is_running(self, instance_id: str) -> bool:
+        """Check whether a plugin instance has a live worker entry.
+        
+        Args:
+            instance_id: Plugin instance ID
+            
+        Returns:
+            True if the instance is in the process table
+        """
+        return instance_id in self._index
+    
+    def _columns(self) -> tuple:
+        """Get all process table columns."""
+        return (
+            self._instance_ids, self._plugin_ids, self._processes, self._polls,
+            self._transports, self._endpoints, self._started, self._last_hb,
+            self._last_render,
+        )
+    
+    def _add_process(
+        self,
+        instance_id: str,
+        plugin_id: str,
+        process: subprocess.Popen,
+        transport: ZMQTransport,
+        endpoint: str
+    ) -> None:
+        """Append a row to the process table."""
+        now = time.time()
+        with self._table_lock:
+            self._index[instance_id] = len(self._instance_ids)
+            self._instance_ids.append(instance_id)
+            self._plugin_ids.append(plugin_id)
+            self._processes.append(process)
+            self._polls.append(process.poll)
+            self._transports.append(transport)
+            self._endpoints.append(endpoint)
+            self._started.append(now)
+            self._last_hb.append(now)
+            self._last_render.append(None)
+    
+    def _remove_process(self, instance_id: str) -> None:
+        """Remove a row from the process table by swapping in the last row."""
+        with self._table_lock:
+            i = self._index.pop(instance_id)
+            last = len(self._instance_ids) - 1
+            
+            if i != last:
+                self._index[self._instance_ids[last]] = i
+                for column in self._columns():
+                    column[i] = column[last]
+            
+            for column in self._columns():
+                column.pop()
+    
+    def _allocate_endpoint(self) -> str:
+        """Allocate a port and return a new ZMQ endpoint."""
+        port = self._next_port
+        self._next_port += 1
+        return f"tcp://127.0.0.1:{port}"
     
     def spawn_plugin(
         self,
         instance_id: str,
         plugin_id: str,
         worker_script: Path,
-        settings: Dict
+        settings: Dict,
+        module_path: Optional[str] = None,
+        class_name: Optional[str] = None
     ) -> bool:
         """Spawn a new plugin worker process.
         
+        If a worker pool is configured, ``worker_script`` is the generic
+        worker and the plugin class is known, a pre-started generic
+        worker is used instead of launching the script.
+        
         Args:
             instance_id: Unique instance identifier
             plugin_id: Plugin type identifier
             worker_script: Path to worker Python script
             settings: Plugin settings dictionary
+            module_path: Plugin module path (enables pooled workers)
+            class_name: Plugin class name (enables pooled workers)
             
         Returns:
             True if spawned successfully
         """
-        if instance_id in self.processes:
+        if instance_id in self._index:
             logger.warning(f"Plugin instance {instance_id} already running")
             return False
         
-        # Allocate port and create endpoint
-        port = self._next_port
-        self._next_port += 1
-        endpoint = f"tcp://127.0.0.1:{port}"
-        
         try:
-            # Start worker process
-            logger.info(f"Spawning plugin worker: {plugin_id} (instance: {instance_id})")
-            logger.info(f"Worker script: {worker_script}")
-            logger.info(f"Endpoint: {endpoint}")
+            # Take a warm worker from the pool if possible
+            pooled = None
+            if (self._pool and module_path and class_name
+                    and is_generic_worker(worker_script)):
+                pooled = self._pool.acquire()
+            
+            if pooled:
+                process = pooled.process
+                endpoint = pooled.endpoint
+                logger.info(f"Assigning pooled worker to {plugin_id} (instance: {instance_id})")
+            else:
+                # Start worker process
+                endpoint = self._allocate_endpoint()
+                logger.info(f"Spawning plugin worker: {plugin_id} (instance: {instance_id})")
+                logger.info(f"Worker script: {worker_script}")
+                logger.info(f"Endpoint: {endpoint}")
+                
+                process = subprocess.Popen(
+                    [sys.executable, str(worker_script), endpoint, instance_id],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
             
-            process = subprocess.Popen(
-                [sys.executable, str(worker_script), endpoint, instance_id],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+            # Create transport to communicate with worker. ZMQ connects
+            # asynchronously, so the INIT handshake doubles as the readiness
+            # check instead of sleeping a fixed amount after spawning.
+            transport = ZMQTransport(
+                zmq.REQ,
+                endpoint,
+                bind=False,
+                socket_options={
+                    zmq.LINGER: 0,
+                    zmq.IMMEDIATE: 1,
+                    zmq.RECONNECT_IVL: self.CONNECT_RETRY_MS,
+                },
             )
             
-            # Give process time to start
-            time.sleep(0.5)
+            # Wait until the worker has bound its socket (or died)
+            deadline = time.monotonic() + self.STARTUP_TIMEOUT_S
+            ready = False
+            while not ready and time.monotonic() < deadline:
+                if process.poll() is not None:
+                    break
+                ready = bool(transport.socket.poll(self.CONNECT_RETRY_MS, zmq.POLLOUT))
             
-            # Check if process started
-            if process.poll() is not None:
-                stdout, stderr = process.communicate()
-                logger.error(f"Worker process failed to start: {stderr}")
+            # Send INIT message
+            init_msg = InitMessage(instance_id, plugin_id, settings, module_path, class_name)
+            if not ready or not transport.send(init_msg, timeout_ms=5000):
+                if process.poll() is not None:
+                    logger.error(f"Worker process failed to start (exit code {process.returncode})")
+                else:
+                    logger.error(f"Worker process did not become ready: {instance_id}")
+                    process.terminate()
+                transport.close()
                 return False
             
-            # Create transport to communicate with worker
-            transport = ZMQTransport(zmq.REQ, endpoint, bind=False)
-            
-            # Send INIT message
-            init_msg = InitMessage(instance_id, plugin_id, settings)
-            response = transport.send_and_receive(init_msg, timeout_ms=5000)
+            response = transport.receive(timeout_ms=5000)
             
             if not response or response.type == MessageType.ERROR:
                 logger.error(f"Failed to initialize plugin: {response.payload if response else 'timeout'}")
@@ -121,15 +228,7 @@ class PluginSupervisor:
                 return False
             
             # Store process info
-            self.processes[instance_id] = PluginProcess(
-                instance_id=instance_id,
-                plugin_id=plugin_id,
-                process=process,
-                transport=transport,
-                endpoint=endpoint,
-                started=time.time(),
-                last_heartbeat=time.time(),
-            )
+            self._add_process(instance_id, plugin_id, process, transport, endpoint)
             
             logger.info(f"Plugin {plugin_id} spawned successfully (PID: {process.pid})")
             return True
@@ -148,12 +247,12 @@ class PluginSupervisor:
         Returns:
             True if sent successfully
         """
-        if instance_id not in self.processes:
+        i = self._index.get(instance_id)
+        if i is None:
             return False
         
-        proc = self.processes[instance_id]
         msg = UpdateMessage(instance_id, delta_time)
-        response = proc.transport.send_and_receive(msg, timeout_ms=100)
+        response = self._transports[i].send_and_receive(msg, timeout_ms=100)
         
         return response is not None and response.type != MessageType.ERROR
     
@@ -168,17 +267,58 @@ class PluginSupervisor:
         Returns:
             Render data dictionary, or None on error
         """
-        if instance_id not in self.processes:
-            return None
+        with self._table_lock:
+            i = self._index.get(instance_id)
+            if i is None:
+                return None
+            transport = self._transports[i]
         
-        proc = self.processes[instance_id]
         msg = RenderMessage(instance_id, width, height)
-        response = proc.transport.send_and_receive(msg, timeout_ms=500)
+        response = transport.send_and_receive(msg, timeout_ms=500)
+        
+        if response is None or response.type == MessageType.ERROR:
+            return None
         
-        if response and response.type != MessageType.ERROR:
-            return response.payload
+        # Rows may have been swapped or removed while waiting for the reply,
+        # so look the instance up again before touching its cached render
+        with self._table_lock:
+            i = self._index.get(instance_id)
+            if response.payload.get("status") == "not_modified":
+                return self._last_render[i] if i is not None else None
+            if i is not None:
+                self._last_render[i] = response.payload
         
-        return None
+        return response.payload
+    
+    def tick(self, instance_id: str, delta_time: float, width: int, height: int) -> Optional[Dict]:
+        """Update a plugin and fetch its render output in one roundtrip.
+        
+        Args:
+            instance_id: Plugin instance ID
+            delta_time: Time since last update
+            width: Render width
+            height: Render height
+            
+        Returns:
+            Render data dictionary, a not_modified status if the output is
+            unchanged since the last reply, or None on error
+        """
+        i = self._index.get(instance_id)
+        if i is None:
+            return None
+        
+        msg = TickMessage(instance_id, delta_time, width, height)
+        response = self._transports[i].send_and_receive(msg, timeout_ms=500)
+        
+        if not response or response.type == MessageType.ERROR:
+            return None
+        
+        # The worker hashes TICK and RENDER output together, so a later
+        # not_modified RENDER reply refers to this payload
+        if response.payload.get("status") != "not_modified":
+            self._last_render[i] = response.payload
+        
+        return response.payload
     
     def update_settings(self, instance_id: str, settings: Dict) -> bool:
         """Update plugin settings.
@@ -190,12 +330,12 @@ class PluginSupervisor:
         Returns:
             True if updated successfully
         """
-        if instance_id not in self.processes:
+        i = self._index.get(instance_id)
+        if i is None:
             return False
         
-        proc = self.processes[instance_id]
         msg = SettingsChangedMessage(instance_id, settings)
-        response = proc.transport.send_and_receive(msg, timeout_ms=1000)
+        response = self._transports[i].send_and_receive(msg, timeout_ms=1000)
         
         return response is not None and response.type != MessageType.ERROR
     
@@ -205,30 +345,32 @@ class PluginSupervisor:
         Args:
             instance_id: Plugin instance ID
         """
-        if instance_id not in self.processes:
+        i = self._index.get(instance_id)
+        if i is None:
             return
         
-        proc = self.processes[instance_id]
+        process = self._processes[i]
+        transport = self._transports[i]
         
         try:
             # Send shutdown message
             shutdown_msg = ShutdownMessage(instance_id)
-            proc.transport.send(shutdown_msg, timeout_ms=1000)
+            transport.send(shutdown_msg, timeout_ms=1000)
             
             # Wait for graceful shutdown
             try:
-                proc.process.wait(timeout=2.0)
+                process.wait(timeout=2.0)
             except subprocess.TimeoutExpired:
                 logger.warning(f"Plugin {instance_id} didn't shut down gracefully, terminating")
-                proc.process.terminate()
+                process.terminate()
                 try:
-                    proc.process.wait(timeout=1.0)
+                    process.wait(timeout=1.0)
                 except subprocess.TimeoutExpired:
                     logger.error(f"Plugin {instance_id} didn't terminate, killing")
-                    proc.process.kill()
+                    process.kill()
             
             # Close transport
-            proc.transport.close()
+            transport.close()
             
             logger.info(f"Plugin {instance_id} terminated")
             
@@ -236,24 +378,30 @@ class PluginSupervisor:
             logger.error(f"Error terminating plugin {instance_id}: {e}")
         
         finally:
-            del self.processes[instance_id]
+            self._remove_process(instance_id)
     
     def check_health(self) -> None:
         """Check health of all running plugins and restart if needed."""
-        for instance_id in list(self.processes.keys()):
-            proc = self.processes[instance_id]
-            
-            # Check if process is still alive
-            if proc.process.poll() is not None:
-                logger.error(f"Plugin {instance_id} process died unexpectedly")
-                self.terminate_plugin(instance_id)
-                # TODO: Implement auto-restart logic
+        # Sweep the poll column to find dead processes
+        dead = [
+            self._instance_ids[i]
+            for i, poll in enumerate(self._polls)
+            if poll() is not None
+        ]
+        
+        for instance_id in dead:
+            logger.error(f"Plugin {instance_id} process died unexpectedly")
+            self.terminate_plugin(instance_id)
+            # TODO: Implement auto-restart logic
     
     def shutdown_all(self) -> None:
         """Shutdown all plugin processes."""
         logger.info("Shutting down all plugin processes")
-        for instance_id in list(self.processes.keys()):
+        for instance_id in list(self._instance_ids):
             self.terminate_plugin(instance_id)
+        
+        if self._pool:
+            self._pool.shutdown()
     
     def __del__(self):
         """Cleanup on deletion."""
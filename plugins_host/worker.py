@@ -3,6 +3,8 @@
 This module runs in a separate process and hosts a single plugin instance.
 """
 
+import importlib
+import json
 import logging
 import sys
 import traceback
@@ -12,7 +14,7 @@ from pathlib import Path
 
 from ipc.message_schema import IPCMessage, MessageType, ErrorMessage
 from ipc.zmq_transport import ZMQTransport
-from core.plugin_api import WidgetPlugin
+from core.plugin_api import WidgetPlugin, PluginMetadata
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +32,18 @@ class PluginWorker:
         self.endpoint = endpoint
         self.instance_id = instance_id
         self.plugin: Optional[WidgetPlugin] = None
+        self.module_path: Optional[str] = None
+        self.class_name: Optional[str] = None
+        self._last_render_hash: Optional[int] = None
         self.transport: Optional[ZMQTransport] = None
         self.running = True
         
+        # Message handler; swapped for a specialized one once the plugin exists
+        self._handle_message = self._dispatch_message
+        
         # Setup logging
         logging.basicConfig(
-            level=logging.DEBUG,
+            level=logging.INFO,
             format='%(asctime)s [%(levelname)8s] %(name)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
@@ -45,7 +53,9 @@ class PluginWorker:
         try:
             # Create transport (REP socket)
             self.transport = ZMQTransport(zmq.REP, self.endpoint, bind=True)
-            logger.info(f"Plugin worker started (instance: {self.instance_id})")
+            self.transport.socket.setsockopt(zmq.SNDTIMEO, 5000)
+            socket = self.transport.socket
+            logger.info("Plugin worker started (instance: %s)", self.instance_id)
             
             # Main message loop
             while self.running:
@@ -58,17 +68,20 @@ class PluginWorker:
                 # Process message
                 response = self._handle_message(message)
                 
-                # Send response
+                # Send response directly on the socket (hot path)
                 if response:
-                    self.transport.send(response, timeout_ms=5000)
+                    try:
+                        socket.send(response.to_bytes(), copy=False)
+                    except zmq.ZMQError as e:
+                        logger.error("Error sending %s response: %s", response.type.name, e)
             
         except Exception as e:
-            logger.error(f"Worker error: {e}", exc_info=True)
+            logger.error("Worker error: %s", e, exc_info=True)
         
         finally:
             self._cleanup()
     
-    def _handle_message(self, message: IPCMessage) -> Optional[IPCMessage]:
+    def _dispatch_message(self, message: IPCMessage) -> Optional[IPCMessage]:
         """Handle incoming message.
         
         Args:
@@ -90,6 +103,9 @@ class PluginWorker:
             elif message.type == MessageType.RENDER:
                 return self._handle_render(message)
             
+            elif message.type == MessageType.TICK:
+                return self._handle_tick(message)
+            
             elif message.type == MessageType.SETTINGS_CHANGED:
                 return self._handle_settings_changed(message)
             
@@ -100,23 +116,67 @@ class PluginWorker:
                 return self._handle_shutdown(message)
             
             else:
-                logger.warning(f"Unknown message type: {message.type}")
-                return ErrorMessage(self.instance_id, f"Unknown message type: {message.type}")
+                logger.warning("Unknown message type: %s", message.type.name)
+                return ErrorMessage(self.instance_id, f"Unknown message type: {message.type.name}")
         
         except Exception as e:
-            logger.error(f"Error handling message: {e}", exc_info=True)
-            return ErrorMessage(
-                self.instance_id,
-                str(e),
-                traceback.format_exc()
-            )
+            return self._error_response(e)
+    
+    def _handle_message_initialized(self, message: IPCMessage) -> Optional[IPCMessage]:
+        """Handle incoming message once the plugin is initialized.
+        
+        UPDATE arrives every tick, so it is handled here without the
+        plugin None-check; everything else uses the generic dispatcher.
+        
+        Args:
+            message: Received message
+            
+        Returns:
+            Response message
+        """
+        if message.type != MessageType.UPDATE:
+            return self._dispatch_message(message)
+        
+        try:
+            self.plugin.update(message.payload["delta_time"])
+        except Exception as e:
+            return self._error_response(e)
+        
+        return IPCMessage(
+            type=MessageType.UPDATE,
+            instance_id=self.instance_id,
+            payload={"status": "ok"}
+        )
+    
+    def _error_response(self, error: Exception) -> ErrorMessage:
+        """Log a handler exception and build the error response.
+        
+        The traceback is formatted once, and only if ERROR is enabled.
+        
+        Args:
+            error: Exception raised while handling a message
+            
+        Returns:
+            Error message
+        """
+        tb = None
+        if logger.isEnabledFor(logging.ERROR):
+            tb = traceback.format_exc()
+            logger.error("Error handling message: %s\n%s", error, tb)
+        
+        return ErrorMessage(self.instance_id, str(error), tb)
     
     def _handle_init(self, message: IPCMessage) -> IPCMessage:
         """Handle INIT message."""
         plugin_id = message.payload["plugin_id"]
         settings = message.payload["settings"]
         
-        logger.info(f"Initializing plugin: {plugin_id}")
+        # Pooled workers are started before their instance is known
+        self.instance_id = message.instance_id
+        self.module_path = message.payload.get("module_path")
+        self.class_name = message.payload.get("class_name")
+        
+        logger.info("Initializing plugin: %s", plugin_id)
         
         # Create plugin instance (must be implemented by subclass)
         self.plugin = self._create_plugin_instance(plugin_id, settings)
@@ -126,6 +186,8 @@ class PluginWorker:
         
         # Initialize plugin
         self.plugin.init()
+        self._last_render_hash = None
+        self._handle_message = self._handle_message_initialized
         
         return IPCMessage(
             type=MessageType.INIT,
@@ -171,15 +233,58 @@ class PluginWorker:
         
         # Get render output from plugin
         render_data = self.plugin.get_render_data()
+        payload = {
+            "render_data": render_data,
+            "width": width,
+            "height": height,
+        }
+        
+        # Static widgets produce the same output every frame; only the
+        # hash is sent back when nothing changed since the last response
+        render_hash = hash(json.dumps(payload))
+        if render_hash == self._last_render_hash:
+            return IPCMessage(
+                type=MessageType.RENDER,
+                instance_id=self.instance_id,
+                payload={"status": "not_modified", "hash": render_hash}
+            )
+        
+        self._last_render_hash = render_hash
         
         return IPCMessage(
             type=MessageType.RENDER,
             instance_id=self.instance_id,
-            payload={
-                "render_data": render_data,
-                "width": width,
-                "height": height,
-            }
+            payload=payload
+        )
+    
+    def _handle_tick(self, message: IPCMessage) -> IPCMessage:
+        """Handle TICK message (update followed by render)."""
+        if self.plugin is None:
+            return ErrorMessage(self.instance_id, "Plugin not initialized")
+        
+        self.plugin.update(message.payload["delta_time"])
+        render_data = self.plugin.get_render_data()
+        payload = {
+            "render_data": render_data,
+            "width": message.payload["width"],
+            "height": message.payload["height"],
+        }
+        
+        # Shares the RENDER hash, since both reply with the same payload
+        render_hash = hash(json.dumps(payload))
+        if render_hash == self._last_render_hash:
+            return IPCMessage(
+                type=MessageType.TICK,
+                instance_id=self.instance_id,
+                payload={"status": "not_modified", "hash": render_hash}
+            )
+        
+        self._last_render_hash = render_hash
+        
+        return IPCMessage(
+            type=MessageType.TICK,
+            instance_id=self.instance_id,
+            payload=payload
         )
     
     def _handle_settings_changed(self, message: IPCMessage) -> IPCMessage:
@@ -188,7 +293,7 @@ class PluginWorker:
             return ErrorMessage(self.instance_id, "Plugin not initialized")
         
         settings = message.payload["settings"]
-        logger.info(f"Updating settings: {settings}")
+        logger.info("Updating settings: %s", settings)
         
         self.plugin.on_settings_changed(settings)
         
@@ -204,6 +309,7 @@ class PluginWorker:
             logger.info("Disposing plugin")
             self.plugin.dispose()
             self.plugin = None
+            self._handle_message = self._dispatch_message
         
         return IPCMessage(
             type=MessageType.DISPOSE,
@@ -223,7 +329,10 @@ class PluginWorker:
         )
     
     def _create_plugin_instance(self, plugin_id: str, settings: dict) -> Optional[WidgetPlugin]:
-        """Create plugin instance (must be overridden by specific worker).
+        """Create plugin instance.
+        
+        Generic workers import the class named in the INIT message;
+        plugin-specific workers override this method.
         
         Args:
             plugin_id: Plugin identifier
@@ -232,7 +341,32 @@ class PluginWorker:
         Returns:
             Plugin instance, or None on error
         """
-        raise NotImplementedError("Subclass must implement _create_plugin_instance")
+        if not self.module_path or not self.class_name:
+            raise NotImplementedError("Subclass must implement _create_plugin_instance")
+        
+        module = importlib.import_module(self.module_path)
+        plugin_class = getattr(module, self.class_name)
+        
+        if not issubclass(plugin_class, WidgetPlugin):
+            logger.error("Plugin class %s must inherit from WidgetPlugin", self.class_name)
+            return None
+        
+        metadata = PluginMetadata(
+            plugin_id=plugin_id,
+            name=plugin_id,
+            version="",
+            description="",
+            author="",
+            module_path=self.module_path,
+            class_name=self.class_name
+        )
+        
+        return plugin_class(
+            instance_id=self.instance_id,
+            plugin_id=plugin_id,
+            metadata=metadata,
+            settings=settings
+        )
     
     def _cleanup(self):
         """Cleanup resources."""
@@ -240,7 +374,7 @@ class PluginWorker:
             try:
                 self.plugin.dispose()
             except Exception as e:
-                logger.error(f"Error disposing plugin: {e}")
+                logger.error("Error disposing plugin: %s", e)
         
         if self.transport:
             self.transport.close()
@@ -0,0 +1,129 @@
+"""Pool of pre-started plugin worker processes.
+
+Generic workers are launched ahead of time so that spawning a plugin
+does not pay Python interpreter startup and import costs. A pooled
+worker binds its socket and waits for an INIT message naming the
+plugin class to host.
+
+Only plugins that run on the generic worker can use the pool; plugins
+whose manifest names their own worker script always get that script.
+The pool launches nothing until the first pooled spawn asks for a
+worker.
+"""
+
+import logging
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Project root, so the generic worker can be run as a module
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Script that pooled workers run, as a module
+GENERIC_WORKER_SCRIPT = PROJECT_ROOT / "plugins_host" / "worker.py"
+
+
+def is_generic_worker(worker_script: Path) -> bool:
+    """Check whether a worker script is the generic plugin worker.
+    
+    Args:
+        worker_script: Worker script path, absolute or relative to the project root
+        
+    Returns:
+        True if a pooled worker can stand in for the script
+    """
+    path = Path(worker_script)
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+    return path.resolve() == GENERIC_WORKER_SCRIPT
+
+
+@dataclass
+class PooledWorker:
+    """An idle worker process waiting for a plugin assignment."""
+    
+    process: subprocess.Popen
+    endpoint: str
+
+
+class WorkerPool:
+    """Keeps a small number of generic plugin workers warm."""
+    
+    def __init__(self, size: int, allocate_endpoint: Callable[[], str]):
+        """Initialize worker pool.
+        
+        Args:
+            size: Number of idle workers to keep running
+            allocate_endpoint: Callable returning a fresh ZMQ endpoint
+        """
+        self.size = size
+        self._allocate_endpoint = allocate_endpoint
+        self._idle: List[PooledWorker] = []
+        self._started = False
+    
+    def start(self) -> None:
+        """Launch workers until the pool is full."""
+        self._started = True
+        self.refill()
+    
+    def refill(self) -> None:
+        """Drop dead idle workers and top the pool back up."""
+        self._idle = [w for w in self._idle if w.process.poll() is None]
+        
+        while len(self._idle) < self.size:
+            try:
+                self._idle.append(self._launch())
+            except OSError as e:
+                logger.error(f"Failed to launch pooled worker: {e}")
+                break
+    
+    def acquire(self) -> Optional[PooledWorker]:
+        """Take an idle worker from the pool.
+        
+        A replacement is launched immediately so it can warm up in
+        the background. The first call only starts the pool, since
+        its workers would not be warm yet.
+        
+        Returns:
+            Idle worker, or None if the pool is empty
+        """
+        if not self._started:
+            self.start()
+            return None
+        
+        while self._idle:
+            worker = self._idle.pop(0)
+            if worker.process.poll() is None:
+                self.refill()
+                return worker
+        
+        return None
+    
+    def shutdown(self) -> None:
+        """Terminate all idle workers."""
+        for worker in self._idle:
+            worker.process.terminate()
+        
+        for worker in self._idle:
+            try:
+                worker.process.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                worker.process.kill()
+        
+        self._idle.clear()
+    
+    def _launch(self) -> PooledWorker:
+        """Launch a single generic worker process."""
+        endpoint = self._allocate_endpoint()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "plugins_host.worker", endpoint, "pool"],
+            cwd=str(PROJECT_ROOT),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        logger.debug(f"Launched pooled worker (PID: {process.pid}) at {endpoint}")
+        return PooledWorker(process=process, endpoint=endpoint)
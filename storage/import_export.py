@@ -2,15 +2,170 @@
 
 import json
 import logging
+import mmap
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
+from operator import itemgetter
 
-from core.models import Page, Tile
+from core.grid_controller import GridController
 from storage.repository import StorageRepository
 
+try:
+    import orjson
+except ImportError:
+    # Optional; stdlib json is used when orjson is not installed
+    orjson = None
+
+# Raw JSON passthrough (orjson >= 3.9)
+_Fragment = getattr(orjson, "Fragment", None)
+
+try:
+    import ijson
+except ImportError:
+    # Optional; without it validate_layout parses the whole file
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Pages buffered between the import's parsing and writing stages
+IMPORT_QUEUE_SIZE = 16
+
+# Fields every tile in a layout file must have, in the order they are reported
+_REQUIRED_TILE_FIELDS = ("plugin_id", "instance_id", "row", "col", "width", "height")
+
+# Reads the required fields in one call; raises KeyError for the first missing one
+_get_required_tile_fields = itemgetter(*_REQUIRED_TILE_FIELDS)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _compile_bounds_check(rows: int, cols: int) -> Callable[[int, int, int, int], bool]:
+    """Build a tile bounds check with the grid size folded in as literals.
+    
+    For a square power-of-two grid every bound holds exactly when no
+    operand has bits set above the low log2(size) bits (negatives
+    included), so one bitwise expression covers them all; that variant
+    raises TypeError for non-integers. Other grid sizes get a plain
+    chain of comparisons.
+    
+    Args:
+        rows: Number of grid rows.
+        cols: Number of grid columns.
+    
+    Returns:
+        Function (row, col, width, height) -> True if the tile fits.
+    """
+    if rows == cols and rows & (rows - 1) == 0:
+        shift = rows.bit_length() - 1
+        expr = (
+            "not (row | col | (width - 1) | (height - 1)"
+            f" | (row + height - 1) | (col + width - 1)) >> {shift}"
+        )
+    else:
+        expr = (
+            "0 <= row and 0 <= col and 1 <= width and 1 <= height"
+            f" and row + height <= {rows} and col + width <= {cols}"
+        )
+    
+    namespace: Dict[str, Any] = {}
+    source = f"def _tile_in_grid(row, col, width, height):\n    return {expr}\n"
+    exec(compile(source, "<tile bounds check>", "exec"), namespace)
+    return namespace["_tile_in_grid"]
+
+
+# Check that a tile lies within the grid
+_tile_in_grid = _compile_bounds_check(GridController.GRID_ROWS, GridController.GRID_COLS)
+
+
+def _tile_bounds_error(row: Any, col: Any, width: Any, height: Any) -> Optional[str]:
+    """Describe why a tile does not fit the grid.
+    
+    Slow path behind _tile_in_grid, which only accepts ints; integral
+    floats such as 1.0 pass here.
+    
+    Args:
+        row: Tile row.
+        col: Tile column.
+        width: Tile width.
+        height: Tile height.
+    
+    Returns:
+        Error message, or None if the tile fits.
+    """
+    rows = GridController.GRID_ROWS
+    cols = GridController.GRID_COLS
+    try:
+        if row < 0 or row >= rows:
+            return f"invalid row {row}"
+        if col < 0 or col >= cols:
+            return f"invalid col {col}"
+        if width < 1 or width > cols:
+            return f"invalid width {width}"
+        if height < 1 or height > rows:
+            return f"invalid height {height}"
+        if col + width > cols:
+            return "extends beyond grid"
+        if row + height > rows:
+            return "extends beyond grid"
+    
+    except (ValueError, TypeError) as e:
+        return f"invalid position/size - {e}"
+    
+    return None
+
+
+def _embed_json(raw: str) -> Any:
+    """Prepare stored JSON text for embedding in the export document.
+    
+    With orjson's Fragment the text is written through verbatim instead
+    of being decoded and re-encoded.
+    """
+    if _Fragment is not None:
+        return _Fragment(raw)
+    return _loads(raw)
+
+
+def _load_file(path: Path) -> Any:
+    """Deserialize a JSON file.
+    
+    With orjson the file is memory-mapped and parsed in place rather
+    than first being copied into a bytes object.
+    
+    Raises:
+        json.JSONDecodeError: If JSON is invalid (orjson's error subclasses it).
+    """
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped; let the parser report them
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _loads(raw: Union[bytes, str]) -> Any:
+    """Deserialize JSON from UTF-8 bytes or a string.
+    
+    Raises:
+        json.JSONDecodeError: If JSON is invalid (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class LayoutImportExport:
     """Handles import/export of dashboard layouts."""
@@ -35,10 +190,6 @@ class LayoutImportExport:
         Raises:
             OSError: If file cannot be written.
         """
-        # Get all pages
-        pages_data = self.repository.get_all_pages()
-        pages = [Page(**p) for p in pages_data]
-        
         # Build export data
         export_data = {
             "version": self.VERSION,
@@ -46,41 +197,44 @@ class LayoutImportExport:
             "pages": []
         }
         
-        for page in pages:
-            page_data = {
-                "name": page.name,
-                "index_order": page.index_order,
-                "tiles": []
-            }
+        # Get all pages, tiles and widget settings in one query and
+        # group them by page
+        pages_by_id: Dict[int, Dict[str, Any]] = {}
+        
+        for row in self.repository.iter_all_tiles_with_page():
+            page_data = pages_by_id.get(row["page_id"])
+            if page_data is None:
+                page_data = {
+                    "name": row["page_name"],
+                    "index_order": row["index_order"],
+                    "tiles": []
+                }
+                pages_by_id[row["page_id"]] = page_data
+                export_data["pages"].append(page_data)
             
-            # Get tiles for this page
-            tiles_data = self.repository.get_tiles_for_page(page.id)
+            # Page without tiles
+            if row["id"] is None:
+                continue
             
-            for tile_dict in tiles_data:
-                tile = Tile.from_dict(tile_dict)
-                
-                tile_export = {
-                    "plugin_id": tile.plugin_id,
-                    "instance_id": tile.instance_id,
-                    "row": tile.row,
-                    "col": tile.col,
-                    "width": tile.width,
-                    "height": tile.height,
-                    "z_index": tile.z_index,
-                    "state": tile.state
-                }
-                
-                # Include settings if requested
-                if include_settings:
-                    settings = self.repository.get_app_setting(
-                        f"widget_settings_{tile.instance_id}",
-                        {}
-                    )
-                    tile_export["settings"] = settings
-                
-                page_data["tiles"].append(tile_export)
+            # Project the row straight to the export format
+            state_json = row["state_json"]
+            tile_export = {
+                "plugin_id": row["plugin_id"],
+                "instance_id": row["instance_id"],
+                "row": row["row"],
+                "col": row["col"],
+                "width": row["width"],
+                "height": row["height"],
+                "z_index": row["z_index"],
+                "state": _embed_json(state_json) if state_json else {}
+            }
             
-            export_data["pages"].append(page_data)
+            # Include settings if requested
+            if include_settings:
+                settings_json = row["settings_json"]
+                tile_export["settings"] = _embed_json(settings_json) if settings_json else {}
+            
+            page_data["tiles"].append(tile_export)
         
         # Also export app settings
         if include_settings:
@@ -90,8 +244,7 @@ class LayoutImportExport:
         
         # Write to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2)
+        output_path.write_bytes(_dumps(export_data))
         
         logger.info("Exported layout to: %s", output_path)
     
@@ -120,68 +273,52 @@ class LayoutImportExport:
             raise FileNotFoundError(f"Import file not found: {input_path}")
         
         # Load JSON
-        with open(input_path, "r", encoding="utf-8") as f:
-            import_data = json.load(f)
+        import_data = _load_file(input_path)
         
         # Validate version
         version = import_data.get("version")
         if version != self.VERSION:
             logger.warning("Import file version mismatch: %s (expected %s)", version, self.VERSION)
         
-        pages_imported = 0
-        tiles_imported = 0
+        settings: Dict[str, Any] = {}
         
-        # Clear existing layout if not merging
-        if not merge:
-            existing_pages = self.repository.get_all_pages()
-            for page_dict in existing_pages:
-                self.repository.delete_page(page_dict['id'])
-            logger.info("Cleared existing layout")
-        
-        # Import pages and tiles
-        pages_data = import_data.get("pages", [])
-        
-        for page_data in pages_data:
-            # Create page
-            page_id = self.repository.create_page(
-                page_data["name"],
-                page_data.get("index_order", 0)
+        # Everything is written in a single transaction
+        with self.repository.transaction():
+            # Clear existing layout if not merging
+            if not merge:
+                self.repository.delete_all_pages()
+                logger.info("Cleared existing layout")
+            
+            # Import pages and tiles. Tiles are checked and encoded here
+            # while a writer thread inserts the pages already prepared.
+            pages_data = import_data.get("pages", [])
+            pipeline: "queue.Queue[Optional[Tuple[str, int, List[Tuple]]]]" = queue.Queue(
+                maxsize=IMPORT_QUEUE_SIZE
             )
-            pages_imported += 1
             
-            # Import tiles
-            tiles_data = page_data.get("tiles", [])
-            
-            for tile_data in tiles_data:
-                tile = Tile(
-                    id=None,
-                    page_id=page_id,
-                    plugin_id=tile_data["plugin_id"],
-                    instance_id=tile_data["instance_id"],
-                    row=tile_data["row"],
-                    col=tile_data["col"],
-                    width=tile_data["width"],
-                    height=tile_data["height"],
-                    z_index=tile_data.get("z_index", 0),
-                    state=tile_data.get("state", {})
-                )
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                writer = executor.submit(self._write_pages, pipeline)
+                try:
+                    for page_data in pages_data:
+                        tile_rows = self._prepare_tile_rows(
+                            page_data.get("tiles", []),
+                            settings if import_settings else None
+                        )
+                        pipeline.put((
+                            page_data["name"],
+                            page_data.get("index_order", 0),
+                            tile_rows
+                        ))
+                finally:
+                    pipeline.put(None)
                 
-                # Save tile
-                self.repository.create_tile(tile.to_dict())
-                tiles_imported += 1
-                
-                # Import settings if present
-                if import_settings and "settings" in tile_data:
-                    self.repository.set_app_setting(
-                        f"widget_settings_{tile.instance_id}",
-                        tile_data["settings"]
-                    )
-        
-        # Import app settings
-        if import_settings and "app_settings" in import_data:
-            app_settings = import_data["app_settings"]
-            for key, value in app_settings.items():
-                self.repository.set_app_setting(key, value)
+                pages_imported, tiles_imported = writer.result()
+            
+            # Import app settings
+            if import_settings and "app_settings" in import_data:
+                settings.update(import_data["app_settings"])
+            
+            self.repository.set_app_settings_bulk(settings)
         
         logger.info(
             "Imported %d pages, %d tiles from: %s",
@@ -190,18 +327,123 @@ class LayoutImportExport:
         
         return (pages_imported, tiles_imported)
     
-    def validate_layout(self, input_path: Path) -> tuple[bool, str]:
-        """Validate a layout JSON file without importing.
+    def _prepare_tile_rows(
+        self,
+        tiles_data: List[Dict[str, Any]],
+        settings: Optional[Dict[str, Any]]
+    ) -> List[Tuple]:
+        """Check imported tiles and project them to INSERT tuples.
         
         Args:
-            input_path: Path to input JSON file.
+            tiles_data: Tiles of one page from the layout file.
+            settings: Collects widget settings by key, or None to skip them.
+        
+        Returns:
+            Tile tuples without the leading page_id.
+        
+        Raises:
+            ValueError: If a tile is outside the grid or its position or
+                size is not a number.
+        """
+        tile_rows = []
+        
+        for tile_data in tiles_data:
+            # Project straight to the INSERT tuple
+            instance_id = tile_data["instance_id"]
+            row = tile_data["row"]
+            col = tile_data["col"]
+            width = tile_data["width"]
+            height = tile_data["height"]
+            
+            try:
+                in_grid = _tile_in_grid(row, col, width, height)
+            except TypeError:
+                # Not all ints; use the validator's checks and messages
+                error = _tile_bounds_error(row, col, width, height)
+                if error is not None:
+                    raise ValueError(f"Tile {instance_id}: {error}") from None
+                in_grid = True
+            
+            if not in_grid:
+                raise ValueError(
+                    f"Tile {instance_id} is outside the grid: "
+                    f"pos=({row},{col}), size=({width}x{height})"
+                )
+            
+            tile_rows.append((
+                tile_data["plugin_id"], instance_id,
+                row, col, width, height,
+                tile_data.get("z_index", 0),
+                json.dumps(tile_data.get("state", {}))
+            ))
+            
+            # Import settings if present
+            if settings is not None and "settings" in tile_data:
+                settings[f"widget_settings_{instance_id}"] = tile_data["settings"]
+        
+        return tile_rows
+    
+    def _write_pages(self, pipeline: queue.Queue) -> Tuple[int, int]:
+        """Insert prepared pages and tiles until the end marker (None).
+        
+        Runs on the import's writer thread. After an error the rest of the
+        queue is still drained, so the producer never blocks.
+        
+        Args:
+            pipeline: Queue of (name, index_order, tile_rows) items.
+        
+        Returns:
+            Tuple of (pages_imported, tiles_imported).
+        """
+        pages_imported = 0
+        tiles_imported = 0
+        error: Optional[Exception] = None
+        
+        while True:
+            item = pipeline.get()
+            if item is None:
+                break
+            if error is not None:
+                continue
+            
+            name, index_order, tile_rows = item
+            try:
+                page_id = self.repository.create_page(name, index_order)
+                self.repository.create_tiles_bulk([(page_id, *r) for r in tile_rows])
+            except Exception as e:
+                error = e
+                continue
+            
+            pages_imported += 1
+            tiles_imported += len(tile_rows)
+        
+        if error is not None:
+            raise error
+        
+        return (pages_imported, tiles_imported)
+    
+    def validate_layout(
+        self,
+        source: Union[Path, str, bytes, Dict[str, Any]]
+    ) -> tuple[bool, str]:
+        """Validate a layout without importing.
+        
+        Args:
+            source: Path to a layout JSON file, the file's contents as
+                bytes, or an already-parsed layout.
         
         Returns:
             Tuple of (is_valid, error_message).
         """
         try:
-            with open(input_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if isinstance(source, dict):
+                data = source
+            elif isinstance(source, bytes):
+                data = _loads(source)
+            elif ijson is not None:
+                return self._validate_layout_stream(Path(source))
+            else:
+                data = _load_file(Path(source))
             
             # Check required fields
             if "version" not in data:
@@ -212,43 +454,100 @@ class LayoutImportExport:
             
             # Validate pages
             for i, page in enumerate(data["pages"]):
-                if "name" not in page:
-                    return (False, f"Page {i}: missing 'name'")
-                
-                if "tiles" not in page:
-                    return (False, f"Page {i}: missing 'tiles'")
-                
-                # Validate tiles
-                for j, tile in enumerate(page["tiles"]):
-                    required = ["plugin_id", "instance_id", "row", "col", "width", "height"]
-                    for field in required:
-                        if field not in tile:
-                            return (False, f"Page {i}, Tile {j}: missing '{field}'")
-                    
-                    # Validate bounds
-                    try:
-                        row, col = tile["row"], tile["col"]
-                        width, height = tile["width"], tile["height"]
-                        
-                        if row < 0 or row >= 8:
-                            return (False, f"Page {i}, Tile {j}: invalid row {row}")
-                        if col < 0 or col >= 8:
-                            return (False, f"Page {i}, Tile {j}: invalid col {col}")
-                        if width < 1 or width > 8:
-                            return (False, f"Page {i}, Tile {j}: invalid width {width}")
-                        if height < 1 or height > 8:
-                            return (False, f"Page {i}, Tile {j}: invalid height {height}")
-                        if col + width > 8:
-                            return (False, f"Page {i}, Tile {j}: extends beyond grid")
-                        if row + height > 8:
-                            return (False, f"Page {i}, Tile {j}: extends beyond grid")
-                    
-                    except (ValueError, TypeError) as e:
-                        return (False, f"Page {i}, Tile {j}: invalid position/size - {e}")
+                error = self._validate_page(i, page)
+                if error:
+                    return (False, error)
             
             return (True, "Layout file is valid")
         
         except json.JSONDecodeError as e:
             return (False, f"Invalid JSON: {e}")
         except Exception as e:
-            return (False, f"Validation error: {e}")
\ No newline at end of file
+            return (False, f"Validation error: {e}")
+    
+    def _validate_layout_stream(self, input_path: Path) -> tuple[bool, str]:
+        """Validate a layout file while parsing it, one page at a time.
+        
+        Only the page being validated is held in memory, and parsing stops
+        at the first invalid page.
+        
+        Args:
+            input_path: Path to input JSON file.
+        
+        Returns:
+            Tuple of (is_valid, error_message).
+        """
+        top_level_keys = set()
+        builder = None
+        index = 0
+        
+        try:
+            with open(input_path, "rb") as f:
+                for prefix, event, value in ijson.parse(f):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "pages.item" and event == "end_map":
+                            error = self._validate_page(index, builder.value)
+                            if error:
+                                return (False, error)
+                            builder = None
+                            index += 1
+                    
+                    elif prefix == "pages.item":
+                        if event != "start_map":
+                            return (False, f"Page {index}: missing 'name'")
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    
+                    elif prefix == "" and event == "map_key":
+                        top_level_keys.add(value)
+        
+        except ijson.JSONError as e:
+            return (False, f"Invalid JSON: {e}")
+        
+        # Check required fields
+        if "version" not in top_level_keys:
+            return (False, "Missing 'version' field")
+        
+        if "pages" not in top_level_keys:
+            return (False, "Missing 'pages' field")
+        
+        return (True, "Layout file is valid")
+    
+    def _validate_page(self, i: int, page: Dict[str, Any]) -> Optional[str]:
+        """Validate a single page and its tiles.
+        
+        Args:
+            i: Page index in the file.
+            page: Page data.
+        
+        Returns:
+            Error message, or None if the page is valid.
+        """
+        if "name" not in page:
+            return f"Page {i}: missing 'name'"
+        
+        if "tiles" not in page:
+            return f"Page {i}: missing 'tiles'"
+        
+        # Validate tiles
+        for j, tile in enumerate(page["tiles"]):
+            try:
+                _plugin_id, _instance_id, row, col, width, height = _get_required_tile_fields(tile)
+            except KeyError as e:
+                return f"Page {i}, Tile {j}: missing '{e.args[0]}'"
+            
+            # Fast path for the common all-valid case
+            try:
+                if _tile_in_grid(row, col, width, height):
+                    continue
+            except TypeError:
+                # Non-integer values are checked below
+                pass
+            
+            # Validate bounds
+            error = _tile_bounds_error(row, col, width, height)
+            if error is not None:
+                return f"Page {i}, Tile {j}: {error}"
+        
+        return None
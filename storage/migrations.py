@@ -8,7 +8,7 @@ logger = logging.getLogger(__name__)
 
 
 # Schema version history
-CURRENT_SCHEMA_VERSION = 1
+CURRENT_SCHEMA_VERSION = 2
 
 # Migration scripts: (version, description, sql)
 MIGRATIONS: List[Tuple[int, str, str]] = [
@@ -83,6 +83,14 @@ MIGRATIONS: List[Tuple[int, str, str]] = [
         CREATE INDEX IF NOT EXISTS idx_telemetry_instance ON telemetry(instance_id, timestamp);
         """
     ),
+    (
+        2,
+        "Index tiles in render order",
+        """
+        -- Matches ORDER BY z_index, row, col for per-page tile queries
+        CREATE INDEX IF NOT EXISTS idx_tiles_order ON tiles(page_id, z_index, row, col);
+        """
+    ),
 ]
 
 
@@ -92,6 +100,11 @@ def apply_migrations(conn: sqlite3.Connection) -> None:
     Args:
         conn: SQLite connection.
     """
+    # Fast path: PRAGMA user_version mirrors the applied schema version
+    if conn.execute("PRAGMA user_version").fetchone()[0] == CURRENT_SCHEMA_VERSION:
+        logger.debug("Database schema is up to date")
+        return
+    
     cursor = conn.cursor()
     
     # Create schema version table if it doesn't exist
@@ -132,6 +145,9 @@ def apply_migrations(conn: sqlite3.Connection) -> None:
                 logger.error("Migration %d failed: %s", version, e)
                 raise
     
+    # PRAGMA values cannot be bound as parameters
+    conn.execute(f"PRAGMA user_version = {int(CURRENT_SCHEMA_VERSION)}")
+    
     if current_version == CURRENT_SCHEMA_VERSION:
         logger.info("Database schema is up to date")
     else:
@@ -147,6 +163,11 @@ def get_schema_version(conn: sqlite3.Connection) -> int:
     Returns:
         Current schema version number.
     """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version:
+        return version
+    
+    # Databases created before user_version was maintained
     cursor = conn.cursor()
     try:
         cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
@@ -4,24 +4,30 @@ import sqlite3
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from contextlib import contextmanager
 
 from storage.migrations import apply_migrations, get_schema_version
 
 logger = logging.getLogger(__name__)
 
+# Keeps IN (...) lists below SQLite's bound-parameter limit
+MAX_QUERY_PARAMS = 500
+
 
 class StorageRepository:
     """Repository for managing SQLite database operations."""
     
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, durable: bool = True) -> None:
         """Initialize repository with database path.
         
         Args:
             db_path: Path to SQLite database file.
+            durable: If False, keep the journal in memory and never fsync.
+                Only for throwaway databases such as test fixtures.
         """
         self.db_path = db_path
+        self.durable = durable
         self._conn: Optional[sqlite3.Connection] = None
     
     def initialize(self) -> None:
@@ -33,19 +39,51 @@ class StorageRepository:
         self._conn = sqlite3.connect(
             str(self.db_path),
             check_same_thread=False,
-            isolation_level=None  # Autocommit mode
+            isolation_level=None,  # Autocommit mode
+            cached_statements=256
         )
         self._conn.row_factory = sqlite3.Row
         
         # Enable foreign keys
         self._conn.execute("PRAGMA foreign_keys = ON")
         
+        if self.durable:
+            # WAL with NORMAL sync: one fsync per checkpoint instead of per commit
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        else:
+            self._conn.execute("PRAGMA journal_mode = MEMORY")
+            self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        self._conn.execute("PRAGMA mmap_size = 268435456")
+        self._conn.execute("PRAGMA cache_size = -20000")
+        
         # Apply migrations
         apply_migrations(self._conn)
         
         version = get_schema_version(self._conn)
         logger.info("Database initialized at version %d", version)
     
+    def open_reader(self) -> "StorageRepository":
+        """Open a read-only repository on its own connection to the same database.
+        
+        The reader belongs to the thread that calls this method, so a
+        background thread can query while this repository keeps writing.
+        The caller must close it.
+        
+        Returns:
+            Read-only repository.
+        """
+        reader = StorageRepository(self.db_path, durable=self.durable)
+        reader._conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            isolation_level=None,
+            cached_statements=256
+        )
+        reader._conn.row_factory = sqlite3.Row
+        return reader
+    
     @contextmanager
     def transaction(self):
         """Context manager for database transactions.
@@ -111,6 +149,29 @@ class StorageRepository:
             return json.loads(row["value_json"])
         return default
     
+    def get_app_settings(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several application setting values at once.
+        
+        Args:
+            keys: Setting keys.
+        
+        Returns:
+            Dictionary of key to value for the keys that exist.
+        """
+        result: Dict[str, Any] = {}
+        
+        for start in range(0, len(keys), MAX_QUERY_PARAMS):
+            chunk = keys[start:start + MAX_QUERY_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self.execute(
+                f"SELECT key, value_json FROM app_settings WHERE key IN ({placeholders})",
+                tuple(chunk)
+            )
+            for row in cursor.fetchall():
+                result[row["key"]] = json.loads(row["value_json"])
+        
+        return result
+    
     def set_app_setting(self, key: str, value: Any) -> None:
         """Set an application setting value.
         
@@ -130,6 +191,26 @@ class StorageRepository:
             (key, value_json)
         )
     
+    def set_app_settings_bulk(self, settings: Dict[str, Any]) -> None:
+        """Set several application settings in one statement.
+        
+        Args:
+            settings: Mapping of setting key to value (must be JSON-serializable).
+        """
+        if not self._conn:
+            raise RuntimeError("Database not initialized")
+        
+        self._conn.executemany(
+            """
+            INSERT INTO app_settings (key, value_json)
+            VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                value_json = excluded.value_json,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            [(key, json.dumps(value)) for key, value in settings.items()]
+        )
+    
     # Page Methods
     
     def get_all_pages(self) -> List[Dict[str, Any]]:
@@ -141,7 +222,7 @@ class StorageRepository:
         cursor = self.execute(
             "SELECT id, name, index_order FROM pages ORDER BY index_order"
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor]
     
     def create_page(self, name: str, index_order: int = 0) -> int:
         """Create a new page.
@@ -167,6 +248,10 @@ class StorageRepository:
         """
         self.execute("DELETE FROM pages WHERE id = ?", (page_id,))
     
+    def delete_all_pages(self) -> None:
+        """Delete all pages and, through the cascade, all tiles."""
+        self.execute("DELETE FROM pages")
+    
     # Tile Methods
     
     def get_tiles_for_page(self, page_id: int) -> List[Dict[str, Any]]:
@@ -178,6 +263,17 @@ class StorageRepository:
         Returns:
             List of tile dictionaries.
         """
+        return list(self.iter_tiles_for_page(page_id))
+    
+    def iter_tiles_for_page(self, page_id: int) -> Iterator[Dict[str, Any]]:
+        """Iterate over the tiles for a given page without materializing them.
+        
+        Args:
+            page_id: Page ID.
+        
+        Yields:
+            Tile dictionaries.
+        """
         cursor = self.execute(
             """
             SELECT id, page_id, plugin_id, instance_id,
@@ -188,7 +284,42 @@ class StorageRepository:
             """,
             (page_id,)
         )
-        return [dict(row) for row in cursor.fetchall()]
+        
+        for row in cursor:
+            yield dict(row)
+    
+    def get_all_tiles_with_page(self) -> List[Dict[str, Any]]:
+        """Get all pages with their tiles in a single query.
+        
+        Returns:
+            List of row dictionaries (see iter_all_tiles_with_page).
+        """
+        return list(self.iter_all_tiles_with_page())
+    
+    def iter_all_tiles_with_page(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all pages with their tiles from a single query.
+        
+        Pages without tiles yield one row whose tile columns are None.
+        Each tile's stored widget settings are returned as settings_json
+        (None if it has none).
+        
+        Yields:
+            Row dictionaries ordered by page, then tile z-order.
+        """
+        cursor = self.execute(
+            """
+            SELECT p.id AS page_id, p.name AS page_name, p.index_order,
+                   t.id, t.plugin_id, t.instance_id,
+                   t.row, t.col, t.width, t.height, t.z_index, t.state_json,
+                   s.value_json AS settings_json
+            FROM pages p
+            LEFT JOIN tiles t ON t.page_id = p.id
+            LEFT JOIN app_settings s ON s.key = 'widget_settings_' || t.instance_id
+            ORDER BY p.index_order, p.id, t.z_index, t.row, t.col
+            """
+        )
+        for row in cursor:
+            yield dict(row)
     
     def create_tile(self, tile_data: Dict[str, Any]) -> int:
         """Create a new tile.
@@ -219,6 +350,25 @@ class StorageRepository:
         )
         return cursor.lastrowid
     
+    def create_tiles_bulk(self, rows: List[Tuple]) -> None:
+        """Create several tiles in one statement.
+        
+        Args:
+            rows: Tuples of (page_id, plugin_id, instance_id, row, col,
+                width, height, z_index, state_json).
+        """
+        if not self._conn:
+            raise RuntimeError("Database not initialized")
+        
+        self._conn.executemany(
+            """
+            INSERT INTO tiles (page_id, plugin_id, instance_id, row, col, 
+                               width, height, z_index, state_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows
+        )
+    
     def update_tile(self, tile_id: int, tile_data: Dict[str, Any]) -> None:
         """Update an existing tile.
         
@@ -264,5 +414,17 @@ class StorageRepository:
             self.execute("DELETE FROM tiles WHERE page_id = ?", (page_id,))
             
             # Insert new tiles
-            for tile in tiles:
-                self.create_tile(tile)
+            self.create_tiles_bulk([
+                (
+                    tile['page_id'],
+                    tile['plugin_id'],
+                    tile['instance_id'],
+                    tile['row'],
+                    tile['col'],
+                    tile['width'],
+                    tile['height'],
+                    tile.get('z_index', 0),
+                    tile.get('state_json', '{}')
+                )
+                for tile in tiles
+            ])
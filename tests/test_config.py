@@ -12,9 +12,14 @@ class TestConfig(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.config = Config()
     
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self._temp_dir.cleanup()
+    
     def test_default_values(self):
         """Test that default configuration values are set."""
         self.assertEqual(self.config.app_name, "WidgetBoard")
@@ -1,7 +1,7 @@
 """Tests for grid controller."""
 
 import unittest
-from core.models import Tile
+from core.models import Page, Tile
 from core.grid_controller import GridController
 
 
@@ -12,12 +12,16 @@ class TestGridController(unittest.TestCase):
         """Set up test fixtures."""
         self.controller = GridController()
     
+    def _tile(self, row, col, w=2, h=2, tid=1, iid="test-1"):
+        """Create a test tile on page 1."""
+        return Tile(
+            id=tid, page_id=1, plugin_id="test", instance_id=iid,
+            row=row, col=col, width=w, height=h
+        )
+    
     def test_add_tile_no_collision(self):
         """Test adding a tile without collision."""
-        tile = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=0, col=0, width=2, height=2
-        )
+        tile = self._tile(0, 0)
         
         result = self.controller.add_tile(tile)
         self.assertTrue(result)
@@ -25,14 +29,8 @@ class TestGridController(unittest.TestCase):
     
     def test_add_tile_with_collision(self):
         """Test that adding a colliding tile fails."""
-        tile1 = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=0, col=0, width=2, height=2
-        )
-        tile2 = Tile(
-            id=2, page_id=1, plugin_id="test", instance_id="test-2",
-            row=1, col=1, width=2, height=2
-        )
+        tile1 = self._tile(0, 0)
+        tile2 = self._tile(1, 1, tid=2, iid="test-2")
         
         self.controller.add_tile(tile1)
         result = self.controller.add_tile(tile2)
@@ -42,10 +40,7 @@ class TestGridController(unittest.TestCase):
     
     def test_move_tile_valid(self):
         """Test moving a tile to a valid position."""
-        tile = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=0, col=0, width=2, height=2
-        )
+        tile = self._tile(0, 0)
         self.controller.add_tile(tile)
         
         result = self.controller.move_tile(tile, 2, 2)
@@ -56,14 +51,8 @@ class TestGridController(unittest.TestCase):
     
     def test_move_tile_collision(self):
         """Test that moving a tile into collision fails."""
-        tile1 = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=0, col=0, width=2, height=2
-        )
-        tile2 = Tile(
-            id=2, page_id=1, plugin_id="test", instance_id="test-2",
-            row=4, col=4, width=2, height=2
-        )
+        tile1 = self._tile(0, 0)
+        tile2 = self._tile(4, 4, tid=2, iid="test-2")
         
         self.controller.add_tile(tile1)
         self.controller.add_tile(tile2)
@@ -77,10 +66,7 @@ class TestGridController(unittest.TestCase):
     
     def test_resize_tile_valid(self):
         """Test resizing a tile."""
-        tile = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=0, col=0, width=2, height=2
-        )
+        tile = self._tile(0, 0)
         self.controller.add_tile(tile)
         
         result = self.controller.resize_tile(tile, 3, 3)
@@ -91,14 +77,8 @@ class TestGridController(unittest.TestCase):
     
     def test_resize_tile_collision(self):
         """Test that resizing into collision fails."""
-        tile1 = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=0, col=0, width=2, height=2
-        )
-        tile2 = Tile(
-            id=2, page_id=1, plugin_id="test", instance_id="test-2",
-            row=0, col=3, width=2, height=2
-        )
+        tile1 = self._tile(0, 0)
+        tile2 = self._tile(0, 3, tid=2, iid="test-2")
         
         self.controller.add_tile(tile1)
         self.controller.add_tile(tile2)
@@ -125,10 +105,7 @@ class TestGridController(unittest.TestCase):
     
     def test_get_tile_at(self):
         """Test getting tile at a specific position."""
-        tile = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=2, col=3, width=2, height=2
-        )
+        tile = self._tile(2, 3)
         self.controller.add_tile(tile)
         
         # Inside tile
@@ -146,29 +123,38 @@ class TestGridController(unittest.TestCase):
         self.assertEqual(slot, (0, 0))
         
         # With some tiles
-        tile = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=0, col=0, width=2, height=2
-        )
+        tile = self._tile(0, 0)
         self.controller.add_tile(tile)
         
         slot = self.controller.find_empty_slot(2, 2)
         self.assertIsNotNone(slot)
         self.assertNotEqual(slot, (0, 0))
     
+    def test_can_place(self):
+        """Test checking free rectangles without moving anything."""
+        page = Page(id=1, name="Test")
+        self.controller.pages.append(page)
+        self.controller.switch_to_page(1)
+        tile = self._tile(0, 0)
+        self.controller.add_tile(tile)
+        
+        self.assertFalse(self.controller.can_place(1, 1, 2, 2))
+        self.assertTrue(self.controller.can_place(1, 1, 2, 2, exclude_id=tile.id))
+        self.assertTrue(self.controller.can_place(2, 2, 2, 2))
+        
+        # Outside the grid
+        self.assertFalse(self.controller.can_place(7, 7, 2, 2))
+        self.assertFalse(self.controller.can_place(0, 2, 0, 1))
+        
+        self.assertEqual((tile.row, tile.col), (0, 0))
+    
     def test_resolve_collision(self):
         """Test collision resolution."""
-        tile1 = Tile(
-            id=1, page_id=1, plugin_id="test", instance_id="test-1",
-            row=0, col=0, width=2, height=2
-        )
+        tile1 = self._tile(0, 0)
         self.controller.add_tile(tile1)
         
         # Create colliding tile
-        tile2 = Tile(
-            id=2, page_id=1, plugin_id="test", instance_id="test-2",
-            row=1, col=1, width=2, height=2
-        )
+        tile2 = self._tile(1, 1, tid=2, iid="test-2")
         
         # Resolve collision
         new_row, new_col = self.controller.resolve_collision(tile2)
@@ -0,0 +1,89 @@
+"""Tests for grid view."""
+
+import os
+import unittest
+from unittest import mock
+
+# Render without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from core.models import Page, Tile
+from core.grid_controller import GridController
+from core.plugin_loader import PluginLoader
+from storage.repository import StorageRepository
+from ui.grid_view import GridView
+
+
+class TestGridView(unittest.TestCase):
+    """Test cases for GridView."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the application object the widgets need."""
+        cls.app = QApplication.instance() or QApplication([])
+    
+    def setUp(self):
+        """Show a grid with one tile; services are autospecced mocks."""
+        self.controller = GridController()
+        self.controller.pages.append(Page(id=1, name="Test"))
+        self.controller.switch_to_page(1)
+        self.tile = Tile(
+            id=1, page_id=1, plugin_id="clock", instance_id="clock-1",
+            row=0, col=0, width=2, height=2
+        )
+        self.controller.add_tile(self.tile)
+        
+        self.plugin_loader = mock.create_autospec(PluginLoader, instance=True)
+        self.plugin_loader.get_instance.return_value = None
+        self.repository = mock.create_autospec(StorageRepository, instance=True)
+        
+        self.view = GridView(
+            self.controller,
+            plugin_loader=self.plugin_loader,
+            repository=self.repository
+        )
+        self.view.show()
+        self.view.refresh()
+    
+    def tearDown(self):
+        """Dispose of the view."""
+        self.view.close()
+        self.view.deleteLater()
+    
+    def test_remove_tile(self):
+        """Test removing a tile through its widget's remove request."""
+        tile_widget = self.view.tile_widgets[self.tile.id]
+        
+        with mock.patch.object(
+            QMessageBox, "question", return_value=QMessageBox.StandardButton.Yes
+        ):
+            tile_widget.remove_requested.emit()
+        
+        self.plugin_loader.dispose_instance.assert_called_once_with("clock-1")
+        self.repository.delete_tile.assert_called_once_with(1)
+        self.assertEqual(self.controller.tiles, [])
+        self.assertNotIn(self.tile.id, self.view.tile_widgets)
+    
+    def test_save_tile_settings(self):
+        """Test that accepted settings reach the plugin and the database."""
+        plugin = mock.Mock()
+        self.plugin_loader.get_instance.return_value = plugin
+        self.plugin_loader.get_metadata.return_value = mock.Mock(
+            schema_path="clock.json"
+        )
+        
+        with mock.patch.object(self.view, "_get_settings_schema", return_value={}), \
+                mock.patch("ui.settings_dialog.SettingsDialog") as dialog_class:
+            dialog_class.return_value.exec.return_value = True
+            dialog_class.return_value.get_settings.return_value = {"format": "24h"}
+            self.view._show_tile_settings(self.tile)
+        
+        self.assertEqual(self.tile.state, {"format": "24h"})
+        plugin.on_settings_changed.assert_called_once_with({"format": "24h"})
+        self.repository.update_tile.assert_called_once_with(1, self.tile.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
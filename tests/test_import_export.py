@@ -12,25 +12,41 @@ from core.models import Tile
 class TestImportExport(unittest.TestCase):
     """Test cases for LayoutImportExport."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test.db"
-        self.export_path = Path(self.temp_dir) / "export.json"
+    @classmethod
+    def setUpClass(cls):
+        """Create one in-memory database shared by all tests."""
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.export_path = Path(cls._temp_dir.name) / "export.json"
         
         # Create repository
-        self.repo = StorageRepository(self.db_path)
-        self.repo.initialize()
+        cls.repo = StorageRepository(Path(":memory:"))
+        cls.repo.initialize()
         
         # Create importer/exporter
-        self.import_export = LayoutImportExport(self.repo)
+        cls.import_export = LayoutImportExport(cls.repo)
+        
+        # Export the test data once for the tests that only consume it
+        cls._create_test_data()
+        cls.import_export.export_layout(cls.export_path)
+        cls._exported_bytes = cls.export_path.read_bytes()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared database and remove the export directory."""
+        cls.repo.close()
+        cls._temp_dir.cleanup()
+    
+    @classmethod
+    def _create_test_data(cls):
+        """Reset the shared database and create the test page and tile."""
+        cls.repo.delete_all_pages()
+        cls.repo.execute("DELETE FROM app_settings")
         
-        # Create test data
-        self.page_id = self.repo.create_page("Test Page", 0)
+        page_id = cls.repo.create_page("Test Page", 0)
         
         tile = Tile(
             id=None,
-            page_id=self.page_id,
+            page_id=page_id,
             plugin_id="test_widget",
             instance_id="test-1",
             row=0,
@@ -40,11 +56,16 @@ class TestImportExport(unittest.TestCase):
             z_index=0,
             state={"test": "data"}
         )
-        self.repo.create_tile(tile.to_dict())
+        cls.repo.create_tile(tile.to_dict())
+        return page_id
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.repo.close()
+    def setUp(self):
+        """Set up test fixtures."""
+        self.page_id = self._create_test_data()
+    
+    def _write_exported_layout(self):
+        """Write the layout exported in setUpClass to the export path."""
+        self.export_path.write_bytes(self._exported_bytes)
     
     def test_export_layout(self):
         """Test exporting layout to JSON."""
@@ -73,7 +94,7 @@ class TestImportExport(unittest.TestCase):
     def test_import_layout(self):
         """Test importing layout from JSON."""
         # First export
-        self.import_export.export_layout(self.export_path)
+        self._write_exported_layout()
         
         # Clear database
         self.repo.delete_page(self.page_id)
@@ -92,7 +113,7 @@ class TestImportExport(unittest.TestCase):
     def test_import_merge(self):
         """Test merging imported layout with existing."""
         # Export current layout
-        self.import_export.export_layout(self.export_path)
+        self._write_exported_layout()
         
         # Create another page
         page2_id = self.repo.create_page("Page 2", 1)
@@ -109,28 +130,21 @@ class TestImportExport(unittest.TestCase):
     
     def test_validate_valid_layout(self):
         """Test validating a valid layout file."""
-        self.import_export.export_layout(self.export_path)
+        self._write_exported_layout()
         
         is_valid, message = self.import_export.validate_layout(self.export_path)
         self.assertTrue(is_valid)
         self.assertEqual(message, "Layout file is valid")
     
     def test_validate_invalid_layout(self):
-        """Test validating an invalid layout file."""
-        # Create invalid JSON
-        with open(self.export_path, "w") as f:
-            json.dump({"invalid": "data"}, f)
-        
-        is_valid, message = self.import_export.validate_layout(self.export_path)
+        """Test validating an invalid layout."""
+        is_valid, message = self.import_export.validate_layout({"invalid": "data"})
         self.assertFalse(is_valid)
         self.assertIn("version", message.lower())
     
     def test_validate_malformed_json(self):
         """Test validating malformed JSON."""
-        with open(self.export_path, "w") as f:
-            f.write("{ invalid json")
-        
-        is_valid, message = self.import_export.validate_layout(self.export_path)
+        is_valid, message = self.import_export.validate_layout(b"{ invalid json")
         self.assertFalse(is_valid)
         self.assertIn("json", message.lower())
     
@@ -151,12 +165,36 @@ class TestImportExport(unittest.TestCase):
             }]
         }
         
-        with open(self.export_path, "w") as f:
-            json.dump(layout_data, f)
-        
-        is_valid, message = self.import_export.validate_layout(self.export_path)
+        is_valid, message = self.import_export.validate_layout(layout_data)
         self.assertFalse(is_valid)
         self.assertIn("row", message.lower())
+    
+    def test_import_float_position(self):
+        """Test importing tiles whose position is written as floats."""
+        layout_data = {
+            "version": "1.0",
+            "pages": [{
+                "name": "Floats",
+                "tiles": [{
+                    "plugin_id": "test",
+                    "instance_id": "test-float",
+                    "row": 1.0,
+                    "col": 0,
+                    "width": 2,
+                    "height": 2
+                }]
+            }]
+        }
+        self.export_path.write_text(json.dumps(layout_data))
+        
+        pages_count, tiles_count = self.import_export.import_layout(self.export_path)
+        self.assertEqual((pages_count, tiles_count), (1, 1))
+        
+        layout_data["pages"][0]["tiles"][0]["row"] = 7.0
+        self.export_path.write_text(json.dumps(layout_data))
+        
+        with self.assertRaises(ValueError):
+            self.import_export.import_layout(self.export_path)
 
 
 if __name__ == "__main__":
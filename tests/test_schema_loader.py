@@ -12,7 +12,8 @@ class TestSchemaLoader(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.schema_loader = SchemaLoader(Path(self.temp_dir))
         
         # Create a test schema
@@ -44,6 +45,10 @@ class TestSchemaLoader(unittest.TestCase):
         with open(schema_path, "w") as f:
             json.dump(self.test_schema, f)
     
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self._temp_dir.cleanup()
+    
     def test_load_schema(self):
         """Test loading a schema from file."""
         schema_path = Path(self.temp_dir) / "test_schema.json"
@@ -1,5 +1,6 @@
 """Tests for storage repository."""
 
+import sqlite3
 import unittest
 import tempfile
 from pathlib import Path
@@ -10,24 +11,65 @@ from storage.migrations import CURRENT_SCHEMA_VERSION, get_schema_version
 class TestStorageRepository(unittest.TestCase):
     """Test cases for StorageRepository."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test.db"
-        self.repo = StorageRepository(self.db_path)
-        self.repo.initialize()
+    @classmethod
+    def setUpClass(cls):
+        """Create one in-memory database shared by all tests."""
+        cls.repo = StorageRepository(Path(":memory:"))
+        cls.repo.initialize()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared database."""
+        cls.repo.close()
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.repo.close()
+    @classmethod
+    def _seed_pages(cls, count):
+        """Insert ``count`` pages with one executemany in a single transaction."""
+        with cls.repo.transaction() as cursor:
+            cursor.executemany(
+                "INSERT INTO pages (name, index_order) VALUES (?, ?)",
+                [(f"Page {i}", i) for i in range(count)]
+            )
+    
+    def setUp(self):
+        """Reset the shared database to an empty state."""
+        self.repo.delete_all_pages()
+        self.repo.execute("DELETE FROM app_settings")
     
     def test_database_initialization(self):
         """Test that database is initialized with correct schema."""
-        self.assertTrue(self.db_path.exists())
-        
-        # Check schema version
-        version = get_schema_version(self.repo._conn)
-        self.assertEqual(version, CURRENT_SCHEMA_VERSION)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            repo = StorageRepository(db_path, durable=False)
+            repo.initialize()
+            
+            try:
+                self.assertTrue(db_path.exists())
+                
+                # Check schema version
+                version = get_schema_version(repo._conn)
+                self.assertEqual(version, CURRENT_SCHEMA_VERSION)
+            finally:
+                repo.close()
+    
+    def test_open_reader(self):
+        """Test reading through a separate read-only connection."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = StorageRepository(Path(temp_dir) / "test.db")
+            repo.initialize()
+            reader = repo.open_reader()
+            
+            try:
+                repo.create_page("Written", index_order=0)
+                
+                pages = reader.get_all_pages()
+                self.assertEqual([p["name"] for p in pages], ["Written"])
+                
+                with self.assertRaises(sqlite3.OperationalError):
+                    reader.create_page("Not allowed")
+            finally:
+                reader.close()
+                repo.close()
     
     def test_app_settings(self):
         """Test application settings storage and retrieval."""
@@ -42,6 +84,14 @@ class TestStorageRepository(unittest.TestCase):
         result = self.repo.get_app_setting("missing", "default")
         self.assertEqual(result, "default")
     
+    def test_app_settings_bulk(self):
+        """Test setting several application settings at once."""
+        self.repo.set_app_setting("theme", "light")
+        self.repo.set_app_settings_bulk({"theme": "dark", "other": [1, 2]})
+        
+        self.assertEqual(self.repo.get_app_setting("theme"), "dark")
+        self.assertEqual(self.repo.get_app_setting("other"), [1, 2])
+    
     def test_page_creation(self):
         """Test page creation and retrieval."""
         # Create a page
@@ -53,6 +103,17 @@ class TestStorageRepository(unittest.TestCase):
         self.assertEqual(len(pages), 1)
         self.assertEqual(pages[0]["name"], "Test Page")
     
+    def test_many_pages_ordered(self):
+        """Test that many pages are returned in index order."""
+        self._seed_pages(200)
+        
+        pages = self.repo.get_all_pages()
+        self.assertEqual(len(pages), 200)
+        self.assertEqual(
+            [p["index_order"] for p in pages],
+            list(range(200))
+        )
+    
     def test_page_deletion(self):
         """Test page deletion."""
         # Create and delete a page
@@ -63,6 +124,48 @@ class TestStorageRepository(unittest.TestCase):
         pages = self.repo.get_all_pages()
         self.assertEqual(len(pages), 0)
     
+    def test_create_tiles_bulk(self):
+        """Test creating several tiles at once."""
+        page_id = self.repo.create_page("Test Page")
+        self.repo.create_tiles_bulk([
+            (page_id, "clock", "clock-1", 0, 0, 2, 2, 0, "{}"),
+            (page_id, "links", "links-1", 2, 0, 4, 1, 1, '{"a": 1}'),
+        ])
+        
+        tiles = self.repo.get_tiles_for_page(page_id)
+        self.assertEqual([t["instance_id"] for t in tiles], ["clock-1", "links-1"])
+        self.assertEqual(tiles[1]["state_json"], '{"a": 1}')
+    
+    def test_update_tile_state(self):
+        """Test that updated tile state is returned on the next read."""
+        page_id = self.repo.create_page("Test Page")
+        tile_id = self.repo.create_tile({
+            "page_id": page_id, "plugin_id": "clock", "instance_id": "clock-1",
+            "row": 0, "col": 0, "width": 2, "height": 2, "state_json": '{"a": 1}'
+        })
+        
+        tiles = self.repo.get_tiles_for_page(page_id)
+        self.assertEqual(tiles[0]["state_json"], '{"a": 1}')
+        
+        self.repo.update_tile(tile_id, {
+            "row": 0, "col": 0, "width": 2, "height": 2, "state_json": '{"a": 2}'
+        })
+        tiles = self.repo.get_tiles_for_page(page_id)
+        self.assertEqual(tiles[0]["state_json"], '{"a": 2}')
+    
+    def test_get_all_tiles_with_page(self):
+        """Test fetching pages and tiles in one query."""
+        page_id = self.repo.create_page("Tiles", index_order=0)
+        self.repo.create_page("Empty", index_order=1)
+        self.repo.create_tiles_bulk([
+            (page_id, "clock", "clock-1", 0, 0, 2, 2, 0, "{}"),
+        ])
+        
+        rows = self.repo.get_all_tiles_with_page()
+        self.assertEqual([r["page_name"] for r in rows], ["Tiles", "Empty"])
+        self.assertEqual(rows[0]["instance_id"], "clock-1")
+        self.assertIsNone(rows[1]["id"])
+    
     def test_transaction_rollback(self):
         """Test that transaction rollback works."""
         try:
@@ -0,0 +1,41 @@
+"""Tests for the plugin worker message handlers."""
+
+import unittest
+from unittest import mock
+
+from ipc.message_schema import MessageType, TickMessage
+from plugins_host.worker import PluginWorker
+
+
+class TestPluginWorker(unittest.TestCase):
+    """Test cases for PluginWorker."""
+    
+    def setUp(self):
+        """Create a worker hosting a plugin with fixed output."""
+        self.worker = PluginWorker("tcp://127.0.0.1:5999", "clock-1")
+        self.worker.plugin = mock.Mock()
+        self.worker.plugin.get_render_data.return_value = {"layout": "text", "content": {"text": "12:00"}}
+    
+    def test_tick_unchanged_output_not_modified(self):
+        """Test that a second identical tick only returns the hash."""
+        first = self.worker._handle_tick(TickMessage("clock-1", 0.016, 400, 300))
+        self.assertEqual(first.type, MessageType.TICK)
+        self.assertEqual(first.payload["render_data"]["content"], {"text": "12:00"})
+        
+        second = self.worker._handle_tick(TickMessage("clock-1", 0.016, 400, 300))
+        self.assertEqual(second.type, MessageType.TICK)
+        self.assertEqual(second.payload["status"], "not_modified")
+        self.assertNotIn("render_data", second.payload)
+        self.assertEqual(self.worker.plugin.update.call_count, 2)
+    
+    def test_tick_changed_output_resent(self):
+        """Test that changed output is sent in full."""
+        self.worker._handle_tick(TickMessage("clock-1", 0.016, 400, 300))
+        self.worker.plugin.get_render_data.return_value = {"layout": "text", "content": {"text": "12:01"}}
+        
+        response = self.worker._handle_tick(TickMessage("clock-1", 0.016, 400, 300))
+        self.assertEqual(response.payload["render_data"]["content"], {"text": "12:01"})
+
+
+if __name__ == "__main__":
+    unittest.main()
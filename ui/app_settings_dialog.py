@@ -3,7 +3,7 @@
 import logging
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QDialogButtonBox,
-    QSpinBox, QComboBox, QCheckBox, QGroupBox, QLabel
+    QSpinBox, QComboBox, QCheckBox, QLabel, QTabWidget, QWidget
 )
 from PySide6.QtCore import Qt
 
@@ -30,124 +30,157 @@ class AppSettingsDialog(QDialog):
         self.setMinimumWidth(500)
         
         self._setup_ui()
-        self._load_settings()
+    
+    # Tab sections in display order: (name, title)
+    SECTIONS = (
+        ("appearance", "Appearance"),
+        ("grid", "Grid Settings"),
+        ("window", "Window"),
+        ("advanced", "Advanced"),
+    )
     
     def _setup_ui(self) -> None:
-        """Set up the dialog UI."""
+        """Set up the dialog UI.
+        
+        Each tab's controls are built the first time the tab is shown.
+        """
         layout = QVBoxLayout(self)
         
-        # Appearance group
-        appearance_group = QGroupBox("Appearance")
-        appearance_layout = QFormLayout()
+        # Sections already built
+        self._built = set()
         
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItem("Light", "light")
-        self.theme_combo.addItem("Dark", "dark")
-        appearance_layout.addRow("Theme:", self.theme_combo)
+        self.tabs = QTabWidget()
+        for _, title in self.SECTIONS:
+            self.tabs.addTab(QWidget(), title)
+        self.tabs.currentChanged.connect(self._ensure_section_built)
+        layout.addWidget(self.tabs)
         
-        appearance_group.setLayout(appearance_layout)
-        layout.addWidget(appearance_group)
+        self._ensure_section_built(self.tabs.currentIndex())
         
-        # Grid group
-        grid_group = QGroupBox("Grid Settings")
-        grid_layout = QFormLayout()
+        # Button box
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | 
+            QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.accepted.connect(self._on_accept)
+        button_box.rejected.connect(self.reject)
+        
+        layout.addWidget(button_box)
+    
+    def _ensure_section_built(self, index: int) -> None:
+        """Build a tab's controls and load their values, once.
         
+        Args:
+            index: Tab index.
+        """
+        if index < 0:
+            return
+        
+        name = self.SECTIONS[index][0]
+        if name in self._built:
+            return
+        
+        form = QFormLayout(self.tabs.widget(index))
+        getattr(self, f"_build_{name}_section")(form)
+        self._built.add(name)
+        self._load_section(name)
+    
+    def _build_appearance_section(self, form: QFormLayout) -> None:
+        """Build the appearance controls."""
+        self.theme_combo = QComboBox()
+        self.theme_combo.addItem("Light", "light")
+        self.theme_combo.addItem("Dark", "dark")
+        form.addRow("Theme:", self.theme_combo)
+    
+    def _build_grid_section(self, form: QFormLayout) -> None:
+        """Build the grid controls."""
         self.grid_rows_spin = QSpinBox()
         self.grid_rows_spin.setMinimum(4)
         self.grid_rows_spin.setMaximum(16)
         self.grid_rows_spin.setValue(8)
         self.grid_rows_spin.setEnabled(False)  # Fixed for M2
-        grid_layout.addRow("Grid Rows:", self.grid_rows_spin)
+        form.addRow("Grid Rows:", self.grid_rows_spin)
         
         self.grid_cols_spin = QSpinBox()
         self.grid_cols_spin.setMinimum(4)
         self.grid_cols_spin.setMaximum(16)
         self.grid_cols_spin.setValue(8)
         self.grid_cols_spin.setEnabled(False)  # Fixed for M2
-        grid_layout.addRow("Grid Columns:", self.grid_cols_spin)
+        form.addRow("Grid Columns:", self.grid_cols_spin)
         
         grid_note = QLabel("Note: Grid size is fixed at 8×8 in this version.")
         grid_note.setStyleSheet("color: #666; font-style: italic;")
-        grid_layout.addRow("", grid_note)
-        
-        grid_group.setLayout(grid_layout)
-        layout.addWidget(grid_group)
-        
-        # Window group
-        window_group = QGroupBox("Window")
-        window_layout = QFormLayout()
-        
+        form.addRow("", grid_note)
+    
+    def _build_window_section(self, form: QFormLayout) -> None:
+        """Build the window controls."""
         self.window_width_spin = QSpinBox()
         self.window_width_spin.setMinimum(800)
         self.window_width_spin.setMaximum(4000)
         self.window_width_spin.setSingleStep(100)
-        window_layout.addRow("Default Width:", self.window_width_spin)
+        form.addRow("Default Width:", self.window_width_spin)
         
         self.window_height_spin = QSpinBox()
         self.window_height_spin.setMinimum(600)
         self.window_height_spin.setMaximum(3000)
         self.window_height_spin.setSingleStep(100)
-        window_layout.addRow("Default Height:", self.window_height_spin)
-        
-        window_group.setLayout(window_layout)
-        layout.addWidget(window_group)
-        
-        # Advanced group
-        advanced_group = QGroupBox("Advanced")
-        advanced_layout = QFormLayout()
-        
+        form.addRow("Default Height:", self.window_height_spin)
+    
+    def _build_advanced_section(self, form: QFormLayout) -> None:
+        """Build the advanced controls."""
         self.dev_mode_check = QCheckBox()
         self.dev_mode_check.setEnabled(False)  # Read-only for now
-        advanced_layout.addRow("Developer Mode:", self.dev_mode_check)
+        form.addRow("Developer Mode:", self.dev_mode_check)
         
         dev_note = QLabel("Set WIDGETBOARD_DEV=true environment variable to enable.")
         dev_note.setStyleSheet("color: #666; font-style: italic; font-size: 10px;")
-        advanced_layout.addRow("", dev_note)
+        form.addRow("", dev_note)
+    
+    def _load_section(self, name: str) -> None:
+        """Load current settings into a section's controls.
         
-        advanced_group.setLayout(advanced_layout)
-        layout.addWidget(advanced_group)
+        Args:
+            name: Section name.
+        """
+        if name == "appearance":
+            theme_index = self.theme_combo.findData(self.config.theme)
+            if theme_index >= 0:
+                self.theme_combo.setCurrentIndex(theme_index)
         
-        layout.addStretch()
+        elif name == "window":
+            self.window_width_spin.setValue(self.config.window_width)
+            self.window_height_spin.setValue(self.config.window_height)
         
-        # Button box
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | 
-            QDialogButtonBox.StandardButton.Cancel
-        )
-        button_box.accepted.connect(self._on_accept)
-        button_box.rejected.connect(self.reject)
+        elif name == "grid":
+            self.grid_rows_spin.setValue(self.config.grid_rows)
+            self.grid_cols_spin.setValue(self.config.grid_cols)
         
-        layout.addWidget(button_box)
-    
-    def _load_settings(self) -> None:
-        """Load current settings into form."""
-        # Theme
-        theme_index = self.theme_combo.findData(self.config.theme)
-        if theme_index >= 0:
-            self.theme_combo.setCurrentIndex(theme_index)
-        
-        # Window size
-        self.window_width_spin.setValue(self.config.window_width)
-        self.window_height_spin.setValue(self.config.window_height)
-        
-        # Grid
-        self.grid_rows_spin.setValue(self.config.grid_rows)
-        self.grid_cols_spin.setValue(self.config.grid_cols)
-        
-        # Dev mode
-        self.dev_mode_check.setChecked(self.config.dev_mode)
+        elif name == "advanced":
+            self.dev_mode_check.setChecked(self.config.dev_mode)
     
     def _on_accept(self) -> None:
-        """Save settings and close."""
-        # Update config
-        self.config.theme = self.theme_combo.currentData()
-        self.config.window_width = self.window_width_spin.value()
-        self.config.window_height = self.window_height_spin.value()
-        self.config.grid_rows = self.grid_rows_spin.value()
-        self.config.grid_cols = self.grid_cols_spin.value()
-        
-        # Save to file
-        self.config.save_settings()
-        
-        logger.info("Application settings saved")
-        self.accept()
\ No newline at end of file
+        """Save changed settings and close."""
+        # Collect values; sections never opened keep their values
+        values = {}
+        if "appearance" in self._built:
+            values["theme"] = self.theme_combo.currentData()
+        if "window" in self._built:
+            values["window_width"] = self.window_width_spin.value()
+            values["window_height"] = self.window_height_spin.value()
+        if "grid" in self._built:
+            values["grid_rows"] = self.grid_rows_spin.value()
+            values["grid_cols"] = self.grid_cols_spin.value()
+        
+        changed = {
+            key: value for key, value in values.items()
+            if getattr(self.config, key) != value
+        }
+        
+        # Only touch the settings file if something changed
+        if changed:
+            for key, value in changed.items():
+                setattr(self.config, key, value)
+            self.config.save_settings()
+            logger.info("Application settings saved: %s", ", ".join(changed))
+        
+        self.accept()
@@ -1,13 +1,52 @@
 """Renders structured plugin data into Qt widgets."""
-from typing import Dict, Any, Optional, List
+import html
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QFrame, QScrollArea, QPushButton
+    QFrame, QPushButton, QListView, QStyledItemDelegate,
+    QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QPixmap, QColor
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex, QRect, QSize
+from PySide6.QtGui import QFont, QPixmap, QColor, QFontMetrics, QPainter, QPalette
 from enum import Enum
 
+# Shared style sheets
+_SECONDARY_QSS = "color: #666;"
+_LIST_ITEM_QSS = "QWidget { background: white; border-radius: 4px; }"
+_LIST_VIEW_QSS = "QListView { background: transparent; }"
+_ERROR_QSS = "color: #F44336;"
+
+# Text color -> style sheet, so repeated colors reuse one string
+_COLOR_QSS: Dict[str, str] = {}
+
+# Lists this short are built from labels; longer ones use a QListView,
+# which only paints the rows in view
+_LIST_WIDGET_MAX_ITEMS = 3
+
+# Key-value cards with more pairs than this are one rich-text label
+_KEY_VALUE_WIDGET_MAX_PAIRS = 3
+_KEY_VALUE_TABLE_HTML = '<table width="100%" cellspacing="0" cellpadding="6">{rows}</table>'
+_KEY_VALUE_ROW_HTML = (
+    '<tr><td style="color: #666; font-weight: bold;">{key}</td>'
+    '<td align="right">{value}</td></tr>'
+)
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: Optional[int] = None, bold: bool = False) -> QFont:
+    """Get a shared default-family font.
+    
+    Built on first use, once a QApplication exists. setFont() copies
+    the font, so callers can share one instance.
+    """
+    font = QFont()
+    if point_size is not None:
+        font.setPointSize(point_size)
+    if bold:
+        font.setWeight(QFont.Weight.Bold)
+    return font
+
 
 class CardLayout(Enum):
     """Standard card layout types."""
@@ -19,234 +58,357 @@ class CardLayout(Enum):
     IMAGE_TEXT = "image_text"  # Image with text overlay
 
 
-class DataRenderer:
-    """Factory for creating UI from structured data."""
+class _ListItemModel(QAbstractListModel):
+    """Read-only model over list items.
     
-    @staticmethod
-    def render(data: Dict[str, Any], parent: Optional[QWidget] = None) -> QWidget:
-        """
-        Render data based on layout type.
+    DisplayRole is an item's primary text, UserRole its secondary text.
+    """
+    
+    def __init__(self, items: List[Dict[str, Any]], parent: Optional[QWidget] = None) -> None:
+        """Initialize the model.
         
-        Expected data structure:
-        {
-            "layout": "text" | "metric" | "list" | "key_value" | "header_body",
-            "content": {...}  # Layout-specific content
-        }
+        Args:
+            items: List items, each with "text" and optional "secondary".
+            parent: Parent object.
         """
-        layout_type = data.get("layout", "text")
-        content = data.get("content", {})
-        
-        if layout_type == "text":
-            return DataRenderer._render_text(content, parent)
-        elif layout_type == "metric":
-            return DataRenderer._render_metric(content, parent)
-        elif layout_type == "list":
-            return DataRenderer._render_list(content, parent)
-        elif layout_type == "key_value":
-            return DataRenderer._render_key_value(content, parent)
-        elif layout_type == "header_body":
-            return DataRenderer._render_header_body(content, parent)
-        else:
-            return DataRenderer._render_error(f"Unknown layout: {layout_type}", parent)
+        super().__init__(parent)
+        self._items = items
     
-    @staticmethod
-    def _render_text(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
-        """
-        Render simple text.
-        Expected: {"text": str, "align": "left"|"center"|"right", "size": int}
-        """
-        widget = QWidget(parent)
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
-        
-        label = QLabel(content.get("text", ""))
-        label.setWordWrap(True)
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of items."""
+        return 0 if parent.isValid() else len(self._items)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Get an item's text for the given role."""
+        if not index.isValid():
+            return None
         
-        # Alignment
-        align = content.get("align", "left")
-        if align == "center":
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        elif align == "right":
-            label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.get("text", "")
+        if role == Qt.ItemDataRole.UserRole:
+            return item.get("secondary")
+        return None
+
+
+class _ListItemDelegate(QStyledItemDelegate):
+    """Paints a list item as a card with primary and secondary text."""
+    
+    MARGIN = 8
+    SPACING = 2
+    TEXT_FLAGS = int(Qt.TextFlag.TextWordWrap) | int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+    
+    def _text_heights(self, width: int, index: QModelIndex) -> Tuple[int, int]:
+        """Get the wrapped heights of an item's primary and secondary text."""
+        bounds = QRect(0, 0, width, 0)
+        primary = QFontMetrics(_font(11)).boundingRect(
+            bounds, self.TEXT_FLAGS, index.data(Qt.ItemDataRole.DisplayRole)
+        ).height()
         
-        # Font size
-        size = content.get("size", 12)
-        font = label.font()
-        font.setPointSize(size)
-        label.setFont(font)
+        secondary_text = index.data(Qt.ItemDataRole.UserRole)
+        secondary = 0
+        if secondary_text is not None:
+            secondary = QFontMetrics(_font(9)).boundingRect(
+                bounds, self.TEXT_FLAGS, str(secondary_text)
+            ).height()
         
-        layout.addWidget(label)
-        return widget
+        return primary, secondary
     
-    @staticmethod
-    def _render_metric(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
-        """
-        Render large metric with label.
-        Expected: {"value": str, "label": str, "unit": str, "color": str}
-        """
-        widget = QWidget(parent)
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(4)
-        
-        # Large value
-        value_label = QLabel(str(content.get("value", "—")))
-        value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        value_font = QFont()
-        value_font.setPointSize(36)
-        value_font.setWeight(QFont.Weight.Bold)
-        value_label.setFont(value_font)
-        
-        # Color
-        color = content.get("color", "#333333")
-        value_label.setStyleSheet(f"color: {color};")
-        
-        # Unit (if any)
-        unit = content.get("unit", "")
-        if unit:
-            value_label.setText(f"{content.get('value', '—')} {unit}")
-        
-        # Label
-        label_text = QLabel(content.get("label", ""))
-        label_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label_font = QFont()
-        label_font.setPointSize(11)
-        label_text.setFont(label_font)
-        label_text.setStyleSheet("color: #666;")
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        """Get an item's size with its text wrapped to the view width."""
+        width = self.parent().viewport().width() - 2 * self.parent().spacing()
+        primary, secondary = self._text_heights(width - 2 * self.MARGIN, index)
+        height = 2 * self.MARGIN + primary
+        if secondary:
+            height += self.SPACING + secondary
+        return QSize(width, height)
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        """Paint an item."""
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        layout.addStretch()
-        layout.addWidget(value_label)
-        layout.addWidget(label_text)
-        layout.addStretch()
+        # Card background
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(option.rect, 4, 4)
         
-        return widget
-    
-    @staticmethod
-    def _render_list(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
-        """
-        Render vertical list.
-        Expected: {"items": [{"text": str, "secondary": str}], "max_items": int}
-        """
-        scroll = QScrollArea(parent)
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
-        
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(8)
-        
-        items = content.get("items", [])
-        max_items = content.get("max_items", 10)
-        
-        for item in items[:max_items]:
-            item_widget = QWidget()
-            item_layout = QVBoxLayout(item_widget)
-            item_layout.setContentsMargins(8, 8, 8, 8)
-            item_layout.setSpacing(2)
-            
-            # Primary text
-            primary = QLabel(item.get("text", ""))
-            primary.setWordWrap(True)
-            font = primary.font()
-            font.setPointSize(11)
-            primary.setFont(font)
-            item_layout.addWidget(primary)
-            
-            # Secondary text (optional)
-            if "secondary" in item:
-                secondary = QLabel(item["secondary"])
-                secondary.setWordWrap(True)
-                sec_font = secondary.font()
-                sec_font.setPointSize(9)
-                secondary.setFont(sec_font)
-                secondary.setStyleSheet("color: #666;")
-                item_layout.addWidget(secondary)
-            
-            # Separator
-            item_widget.setStyleSheet("QWidget { background: white; border-radius: 4px; }")
-            layout.addWidget(item_widget)
+        text_rect = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        primary, _ = self._text_heights(text_rect.width(), index)
         
-        layout.addStretch()
-        scroll.setWidget(container)
-        return scroll
-    
-    @staticmethod
-    def _render_key_value(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
-        """
-        Render key-value pairs.
-        Expected: {"pairs": [{"key": str, "value": str}]}
-        """
-        widget = QWidget(parent)
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(12)
-        
-        pairs = content.get("pairs", [])
-        
-        for pair in pairs:
-            row = QWidget()
-            row_layout = QHBoxLayout(row)
-            row_layout.setContentsMargins(0, 0, 0, 0)
-            
-            key_label = QLabel(pair.get("key", ""))
-            key_font = key_label.font()
-            key_font.setWeight(QFont.Weight.Bold)
-            key_label.setFont(key_font)
-            key_label.setStyleSheet("color: #666;")
-            
-            value_label = QLabel(str(pair.get("value", "")))
-            value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            value_label.setWordWrap(True)
-            
-            row_layout.addWidget(key_label)
-            row_layout.addStretch()
-            row_layout.addWidget(value_label, 1)
-            
-            layout.addWidget(row)
+        # Primary text
+        painter.setFont(_font(11))
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.drawText(text_rect, self.TEXT_FLAGS, index.data(Qt.ItemDataRole.DisplayRole))
         
-        layout.addStretch()
-        return widget
-    
-    @staticmethod
-    def _render_header_body(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
-        """
-        Render header with body content.
-        Expected: {"header": str, "body": str}
-        """
-        widget = QWidget(parent)
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(12)
-        
-        # Header
-        header = QLabel(content.get("header", ""))
-        header_font = header.font()
-        header_font.setPointSize(14)
-        header_font.setWeight(QFont.Weight.Bold)
-        header.setFont(header_font)
-        layout.addWidget(header)
-        
-        # Body
-        body = QLabel(content.get("body", ""))
-        body.setWordWrap(True)
-        body.setTextFormat(Qt.TextFormat.PlainText)
-        layout.addWidget(body)
-        layout.addStretch()
+        # Secondary text (optional)
+        secondary_text = index.data(Qt.ItemDataRole.UserRole)
+        if secondary_text is not None:
+            painter.setFont(_font(9))
+            painter.setPen(QColor("#666"))
+            painter.drawText(
+                text_rect.adjusted(0, primary + self.SPACING, 0, 0),
+                self.TEXT_FLAGS,
+                str(secondary_text)
+            )
         
-        return widget
+        painter.restore()
+
+
+def render(data: Dict[str, Any], parent: Optional[QWidget] = None) -> QWidget:
+    """
+    Render data based on layout type.
     
-    @staticmethod
-    def _render_error(message: str, parent: Optional[QWidget]) -> QWidget:
-        """Render error message."""
-        widget = QWidget(parent)
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
+    Expected data structure:
+    {
+        "layout": "text" | "metric" | "list" | "key_value" | "header_body",
+        "content": {...}  # Layout-specific content
+    }
+    """
+    layout_type = data.get("layout", "text")
+    content = data.get("content", {})
+    
+    renderer = _RENDERERS.get(layout_type)
+    if renderer is None:
+        return _render_error(f"Unknown layout: {layout_type}", parent)
+    return renderer(content, parent)
+
+
+def _render_text(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
+    """
+    Render simple text.
+    Expected: {"text": str, "align": "left"|"center"|"right", "size": int}
+    """
+    widget = QWidget(parent)
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(16, 16, 16, 16)
+    
+    label = QLabel(content.get("text", ""))
+    label.setWordWrap(True)
+    
+    # Alignment
+    align = content.get("align", "left")
+    if align == "center":
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    elif align == "right":
+        label.setAlignment(Qt.AlignmentFlag.AlignRight)
+    
+    # Font size
+    label.setFont(_font(content.get("size", 12)))
+    
+    layout.addWidget(label)
+    return widget
+
+
+def _render_metric(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
+    """
+    Render large metric with label.
+    Expected: {"value": str, "label": str, "unit": str, "color": str}
+    """
+    widget = QWidget(parent)
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(16, 16, 16, 16)
+    layout.setSpacing(4)
+    
+    # Large value
+    value_label = QLabel(str(content.get("value", "—")))
+    value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    value_label.setFont(_font(36, bold=True))
+    
+    # Color
+    color = content.get("color", "#333333")
+    qss = _COLOR_QSS.get(color)
+    if qss is None:
+        qss = _COLOR_QSS[color] = f"color: {color};"
+    value_label.setStyleSheet(qss)
+    
+    # Unit (if any)
+    unit = content.get("unit", "")
+    if unit:
+        value_label.setText(f"{content.get('value', '—')} {unit}")
+    
+    # Label
+    label_text = QLabel(content.get("label", ""))
+    label_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    label_text.setFont(_font(11))
+    label_text.setStyleSheet(_SECONDARY_QSS)
+    
+    layout.addStretch()
+    layout.addWidget(value_label)
+    layout.addWidget(label_text)
+    layout.addStretch()
+    
+    return widget
+
+
+def _render_list(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
+    """
+    Render vertical list.
+    Expected: {"items": [{"text": str, "secondary": str}], "max_items": int}
+    """
+    items = content.get("items", [])[:content.get("max_items", 10)]
+    
+    if len(items) <= _LIST_WIDGET_MAX_ITEMS:
+        return _render_list_widgets(items, parent)
+    
+    view = QListView(parent)
+    view.setFrameShape(QFrame.Shape.NoFrame)
+    view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+    view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+    view.setResizeMode(QListView.ResizeMode.Adjust)
+    view.setSpacing(4)
+    view.setStyleSheet(_LIST_VIEW_QSS)
+    view.setModel(_ListItemModel(items, view))
+    view.setItemDelegate(_ListItemDelegate(view))
+    return view
+
+
+def _render_list_widgets(items: List[Dict[str, Any]], parent: Optional[QWidget]) -> QWidget:
+    """Render a short list with one widget per item.
+    
+    A few items fit in a tile, so no scroll area is needed.
+    """
+    container = QWidget(parent)
+    layout = QVBoxLayout(container)
+    layout.setContentsMargins(12, 12, 12, 12)
+    layout.setSpacing(8)
+    
+    for item in items:
+        item_widget = QWidget()
+        item_layout = QVBoxLayout(item_widget)
+        item_layout.setContentsMargins(8, 8, 8, 8)
+        item_layout.setSpacing(2)
+        
+        # Primary text
+        primary = QLabel(item.get("text", ""))
+        primary.setWordWrap(True)
+        primary.setFont(_font(11))
+        item_layout.addWidget(primary)
+        
+        # Secondary text (optional)
+        if "secondary" in item:
+            secondary = QLabel(item["secondary"])
+            secondary.setWordWrap(True)
+            secondary.setFont(_font(9))
+            secondary.setStyleSheet(_SECONDARY_QSS)
+            item_layout.addWidget(secondary)
         
-        label = QLabel(f"⚠ {message}")
+        # Separator
+        item_widget.setStyleSheet(_LIST_ITEM_QSS)
+        layout.addWidget(item_widget)
+    
+    layout.addStretch()
+    return container
+
+
+def _render_key_value(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
+    """
+    Render key-value pairs.
+    Expected: {"pairs": [{"key": str, "value": str}]}
+    """
+    widget = QWidget(parent)
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(16, 16, 16, 16)
+    layout.setSpacing(12)
+    
+    pairs = content.get("pairs", [])
+    
+    if len(pairs) > _KEY_VALUE_WIDGET_MAX_PAIRS:
+        # One label for the whole table instead of a row widget per pair
+        label = QLabel(_KEY_VALUE_TABLE_HTML.format(rows="".join(
+            _KEY_VALUE_ROW_HTML.format(
+                key=html.escape(str(pair.get("key", ""))),
+                value=html.escape(str(pair.get("value", "")))
+            )
+            for pair in pairs
+        )))
+        label.setTextFormat(Qt.TextFormat.RichText)
         label.setWordWrap(True)
-        label.setStyleSheet("color: #F44336;")
         layout.addWidget(label)
         layout.addStretch()
+        return widget
+    
+    for pair in pairs:
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        
+        key_label = QLabel(pair.get("key", ""))
+        key_label.setFont(_font(bold=True))
+        key_label.setStyleSheet(_SECONDARY_QSS)
+        
+        value_label = QLabel(str(pair.get("value", "")))
+        value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        value_label.setWordWrap(True)
+        
+        row_layout.addWidget(key_label)
+        row_layout.addStretch()
+        row_layout.addWidget(value_label, 1)
         
-        return widget
\ No newline at end of file
+        layout.addWidget(row)
+    
+    layout.addStretch()
+    return widget
+
+
+def _render_header_body(content: Dict[str, Any], parent: Optional[QWidget]) -> QWidget:
+    """
+    Render header with body content.
+    Expected: {"header": str, "body": str}
+    """
+    widget = QWidget(parent)
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(16, 16, 16, 16)
+    layout.setSpacing(12)
+    
+    # Header
+    header = QLabel(content.get("header", ""))
+    header.setFont(_font(14, bold=True))
+    layout.addWidget(header)
+    
+    # Body
+    body = QLabel(content.get("body", ""))
+    body.setWordWrap(True)
+    body.setTextFormat(Qt.TextFormat.PlainText)
+    layout.addWidget(body)
+    layout.addStretch()
+    
+    return widget
+
+
+def _render_error(message: str, parent: Optional[QWidget]) -> QWidget:
+    """Render error message."""
+    widget = QWidget(parent)
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(16, 16, 16, 16)
+    
+    label = QLabel(f"⚠ {message}")
+    label.setWordWrap(True)
+    label.setStyleSheet(_ERROR_QSS)
+    layout.addWidget(label)
+    layout.addStretch()
+    
+    return widget
+
+
+# Layout type -> render function
+_RENDERERS = {
+    "text": _render_text,
+    "metric": _render_metric,
+    "list": _render_list,
+    "key_value": _render_key_value,
+    "header_body": _render_header_body,
+}
+
+
+class DataRenderer:
+    """Factory for creating UI from structured data.
+    
+    Kept for existing callers; the module-level render() does the work.
+    """
+    
+    @staticmethod
+    def render(data: Dict[str, Any], parent: Optional[QWidget] = None) -> QWidget:
+        """Render data based on layout type; see render()."""
+        return render(data, parent)
@@ -1,15 +1,16 @@
 """Grid view - displays the 8×8 tile grid with plugin rendering support."""
 
 import logging
-from typing import Dict, Optional
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from PySide6.QtWidgets import QWidget, QMessageBox
-from PySide6.QtCore import Qt, Signal, QPoint, QRect, QSize
-from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtCore import Qt, Signal, QPoint, QRect, QRectF, QSize, QLineF, QTimer
+from PySide6.QtGui import QPainter, QColor, QPen, QPixmap
 
 from core.models import Tile
 from core.grid_controller import GridController
 from ui.tile_widget import TileWidget
-from ui.settings_dialog import SettingsDialog
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +27,28 @@ class GridView(QWidget):
     MIN_CELL_SIZE = 80
     DEFAULT_CELL_SIZE = 120
     
-    def __init__(self, grid_controller: GridController, parent: Optional[QWidget] = None) -> None:
+    # Most hidden tile widgets kept for reuse
+    TILE_POOL_SIZE = 64
+    
+    # Quiet period after a move/resize before layout_changed is emitted
+    SAVE_DELAY_MS = 250
+    
+    def __init__(
+        self,
+        grid_controller: GridController,
+        parent: Optional[QWidget] = None,
+        plugin_loader=None,
+        repository=None
+    ) -> None:
         """Initialize grid view.
         
         Args:
             grid_controller: The grid controller managing tiles.
             parent: Parent widget (should be MainWindow).
+            plugin_loader: Plugin loader managing tile plugin instances.
+                Taken from the parent if not given.
+            repository: Storage repository for saving tiles. Taken from
+                the parent if not given.
         """
         super().__init__(parent)
         
@@ -42,6 +59,40 @@ class GridView(QWidget):
         # Tile widgets mapping
         self.tile_widgets: Dict[int, TileWidget] = {}  # tile.id -> TileWidget
         
+        # Released tile widgets, reused instead of constructing new ones
+        self._tile_pool: List[TileWidget] = []
+        
+        # (row, col) -> ID of the displayed tile covering that cell
+        self._cell_to_tile_id: Dict[Tuple[int, int], int] = {}
+        
+        # Edit-mode grid line pen
+        self._grid_pen = QPen(QColor(200, 200, 200))
+        self._grid_pen.setStyle(Qt.PenStyle.DashLine)
+        
+        # Grid lines pre-rendered for painting in edit mode; built on the
+        # next paint after a resize, so resizing does no grid work
+        self._grid_overlay: Optional[QPixmap] = None
+        
+        # Coalesces the move/resize steps of one drag into a single save
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.layout_changed.emit)
+        
+        # Set when a refresh is skipped while hidden; replayed on show
+        self._refresh_pending = False
+        
+        # Settings schemas by plugin ID, loaded when first needed
+        self._settings_schemas: Dict[str, Dict[str, Any]] = {}
+        
+        # Services owned by the main window
+        if plugin_loader is None:
+            plugin_loader = getattr(parent, 'plugin_loader', None)
+        if repository is None:
+            repository = getattr(parent, 'repository', None)
+        self._plugin_loader = plugin_loader
+        self._repository = repository
+        
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -56,20 +107,59 @@ class GridView(QWidget):
         )
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
     
+    def resizeEvent(self, event) -> None:
+        """Drop the grid overlay so it is rebuilt for the new size."""
+        super().resizeEvent(event)
+        self._grid_overlay = None
+    
+    def showEvent(self, event) -> None:
+        """Apply a refresh that was requested while the view was hidden."""
+        super().showEvent(event)
+        if self._refresh_pending:
+            self.refresh()
+    
+    def set_main_window_refs(self, plugin_loader, repository) -> None:
+        """Set the plugin loader and repository used by the grid.
+        
+        Only needed if they were not available on the parent when the
+        grid view was created.
+        
+        Args:
+            plugin_loader: Plugin loader managing tile plugin instances.
+            repository: Storage repository for saving tiles.
+        """
+        self._plugin_loader = plugin_loader
+        self._repository = repository
+    
+    def clear_plugin_caches(self) -> None:
+        """Forget cached plugin settings schemas.
+        
+        Call after plugins are rediscovered, since a plugin's schema may
+        have changed.
+        """
+        self._settings_schemas.clear()
+    
     def refresh(self) -> None:
-        """Refresh the grid display with tiles from the current page only."""
-        logger.info("=== GridView.refresh() called ===")
+        """Refresh the grid display with tiles from the current page only.
         
-        # Clear existing tile widgets
-        for tile_id, widget in list(self.tile_widgets.items()):
-            logger.debug(f"Removing widget for tile {tile_id}")
-            widget.hide()
-            widget.deleteLater()
-        self.tile_widgets.clear()
+        Only the differences from what is displayed are applied: widgets
+        of removed tiles are released, new tiles get a widget, and kept
+        tiles are rebound or repositioned only if they changed.
+        
+        While the view is hidden the refresh is deferred until it is shown.
+        """
+        if not self.isVisible():
+            self._refresh_pending = True
+            return
+        
+        self._refresh_pending = False
+        logger.info("=== GridView.refresh() called ===")
         
         # Check if we have a current page
         if not self.grid_controller.current_page:
             logger.warning("No current page set, cannot display tiles")
+            self._release_all_tile_widgets()
+            self._update_cell_map()
             self.update()
             return
         
@@ -77,91 +167,61 @@ class GridView(QWidget):
         current_page = self.grid_controller.current_page
         current_page_id = current_page.id
         
-        logger.info(f"Refreshing page '{current_page.name}' (ID: {current_page_id})")
-        
-        # Get tiles for CURRENT page only
-        tiles = self.grid_controller.tiles_by_page.get(current_page_id, [])
-        
-        logger.info(f"Found {len(tiles)} tiles for current page")
-        
-        # If no tiles, just update and return
-        if not tiles:
-            logger.info("No tiles to display on current page")
-            self.update()
-            return
-        
-        # Track processed tile IDs to prevent duplicates
-        processed_tile_ids = set()
+        logger.debug("Refreshing page '%s' (ID: %s)", current_page.name, current_page_id)
         
-        # Create and show widgets for each tile on current page
-        for tile in tiles:
+        # Get tiles for CURRENT page only, keyed by ID (first one wins)
+        current_tiles: Dict[int, Tile] = {}
+        for tile in self.grid_controller.tiles_by_page.get(current_page_id, []):
             # CRITICAL: Skip if already processed (duplicate)
-            if tile.id in processed_tile_ids:
-                logger.warning(f"Skipping duplicate tile {tile.id}")
+            if tile.id in current_tiles:
+                logger.warning("Skipping duplicate tile %s", tile.id)
                 continue
             
             # CRITICAL: Double-check tile belongs to current page
             if tile.page_id != current_page_id:
                 logger.warning(
-                    f"Skipping tile {tile.id} - belongs to page {tile.page_id}, "
-                    f"not current page {current_page_id}"
+                    "Skipping tile %s - belongs to page %s, not current page %s",
+                    tile.id, tile.page_id, current_page_id
                 )
                 continue
             
-            logger.info(
-                f"Creating widget for tile {tile.id}: {tile.plugin_id} "
-                f"at ({tile.row}, {tile.col})"
-            )
-            
-            try:
-                # Create tile widget
-                tile_widget = self._create_tile_widget(tile)
-                
-                # Ensure parent is set
-                tile_widget.setParent(self)
-                
-                # Set edit mode state
-                tile_widget.set_edit_mode(self.edit_mode)
-                
-                # Update geometry to match tile position/size
-                tile_widget.update_geometry()
-                
-                # Show the widget
-                tile_widget.show()
-                tile_widget.raise_()
-                
-                # Store in dictionary
-                self.tile_widgets[tile.id] = tile_widget
-                
-                # Mark as processed
-                processed_tile_ids.add(tile.id)
-                
-                logger.debug(
-                    f"  Widget created: visible={tile_widget.isVisible()}, "
-                    f"geometry={tile_widget.geometry()}"
-                )
-                
-            except Exception as e:
-                logger.error(
-                    f"Error creating tile widget for {tile.id}: {e}",
-                    exc_info=True
-                )
+            current_tiles[tile.id] = tile
+        
+        logger.debug("Found %d tiles for current page", len(current_tiles))
+        
+        # Suspend painting while widgets are shown, hidden and moved so
+        # the changes land in a single paint
+        self.setUpdatesEnabled(False)
+        try:
+            self._sync_tile_widgets(current_tiles)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        self._update_cell_map()
         
         logger.info(
-            f"Refresh complete: {len(self.tile_widgets)} widgets displayed "
-            f"on page '{current_page.name}'"
+            "Refresh complete: %d widgets displayed on page '%s'",
+            len(self.tile_widgets), current_page.name
         )
         
-        # Force repaint
+        # Schedule a repaint; Qt merges it with any other pending updates
         self.update()
-        self.repaint()
 
+    def flush_layout_changes(self) -> None:
+        """Emit layout_changed now if a move or resize is still waiting to be reported."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.layout_changed.emit()
+    
     def set_edit_mode(self, enabled: bool) -> None:
         """Enable or disable edit mode.
         
         Args:
             enabled: True to enable edit mode, False to disable
         """
+        if enabled == self.edit_mode:
+            return
+        
         self.edit_mode = enabled
         
         logger.info(f"Grid edit mode: {enabled}")
@@ -170,11 +230,66 @@ class GridView(QWidget):
         for tile_widget in self.tile_widgets.values():
             tile_widget.set_edit_mode(enabled)
         
+        # The overlay is only drawn in edit mode
+        if not enabled:
+            self._grid_overlay = None
+        
         # Trigger repaint to show/hide grid overlay
         self.update()
 
 
     
+    def _sync_tile_widgets(self, current_tiles: Dict[int, Tile]) -> None:
+        """Bring the displayed tile widgets in line with the page's tiles.
+        
+        Args:
+            current_tiles: Tiles of the current page, keyed by ID.
+        """
+        # Release widgets whose tiles are gone
+        for tile_id in self.tile_widgets.keys() - current_tiles.keys():
+            logger.debug("Removing widget for tile %s", tile_id)
+            self._release_tile_widget(self.tile_widgets.pop(tile_id))
+        
+        for tile_id, tile in current_tiles.items():
+            tile_widget = self.tile_widgets.get(tile_id)
+            
+            try:
+                if tile_widget is None:
+                    logger.debug(
+                        "Creating widget for tile %s: %s at (%d, %d)",
+                        tile.id, tile.plugin_id, tile.row, tile.col
+                    )
+                    tile_widget = self._create_tile_widget(tile)
+                    
+                    # Ensure parent is set
+                    tile_widget.setParent(self)
+                    
+                    # Update geometry to match tile position/size
+                    tile_widget.update_geometry()
+                    
+                    # Show the widget; tiles never overlap, so no raise_() is needed
+                    tile_widget.show()
+                    
+                    # Store in dictionary
+                    self.tile_widgets[tile_id] = tile_widget
+                    continue
+                
+                # Rebuild the content only if the tile object or its plugin was replaced
+                plugin = self._get_plugin(tile)
+                if tile_widget.tile is not tile or tile_widget.plugin is not plugin:
+                    tile_widget.release()
+                    tile_widget.rebind(tile, self.cell_size, plugin)
+                    tile_widget.set_edit_mode(self.edit_mode)
+                    tile_widget.show()
+                elif tile_widget.geometry_key != (tile.row, tile.col, tile.width, tile.height):
+                    tile_widget.update_geometry()
+                
+            except Exception as e:
+                logger.error(
+                    "Error creating tile widget for %s: %s", tile.id, e,
+                    exc_info=True
+                )
+    
     def _create_tile_widget(self, tile: Tile) -> TileWidget:
         """Create a visual widget for a tile.
         
@@ -184,77 +299,117 @@ class GridView(QWidget):
         Returns:
             TileWidget instance.
         """
-        # Get plugin instance if exists
-        plugin = None
-        if hasattr(self.parent(), 'plugin_loader'):
-            plugin = self.parent().plugin_loader.get_instance(tile.instance_id)
+        plugin = self._get_plugin(tile)
+        
+        # Reuse a pooled widget if there is one
+        if self._tile_pool:
+            tile_widget = self._tile_pool.pop()
+            tile_widget.rebind(tile, self.cell_size, plugin)
+            tile_widget.set_edit_mode(self.edit_mode)
+            return tile_widget
         
         # Create tile widget with plugin
         tile_widget = TileWidget(tile, self.cell_size, self, plugin)
         tile_widget.set_edit_mode(self.edit_mode)
         
-        # Connect signals
-        tile_widget.move_requested.connect(
-            lambda r, c, t=tile: self._handle_move_request(t, r, c)
-        )
-        tile_widget.resize_requested.connect(
-            lambda w, h, t=tile: self._handle_resize_request(t, w, h)
-        )
-        tile_widget.remove_requested.connect(
-            lambda t=tile: self._handle_remove_request(t)
-        )
-        
-
-
+        # Connect signals; handlers take the widget and read its current
+        # tile, so the connections stay valid when the widget is rebound
+        tile_widget.move_requested.connect(partial(self._handle_move_request, tile_widget))
+        tile_widget.resize_requested.connect(partial(self._handle_resize_request, tile_widget))
+        tile_widget.remove_requested.connect(partial(self._handle_remove_request, tile_widget))
         
         return tile_widget
     
-    def _handle_move_request(self, tile: Tile, new_row: int, new_col: int) -> None:
+    def _get_plugin(self, tile: Tile):
+        """Get the plugin instance for a tile, if one exists.
+        
+        Args:
+            tile: The tile model.
+        
+        Returns:
+            Plugin instance, or None.
+        """
+        if self._plugin_loader is not None:
+            return self._plugin_loader.get_instance(tile.instance_id)
+        return None
+    
+    def _update_cell_map(self) -> None:
+        """Rebuild the map from grid cells to displayed tile IDs."""
+        cells = {}
+        for tile_id, tile_widget in self.tile_widgets.items():
+            tile = tile_widget.tile
+            for row in range(tile.row, tile.row + tile.height):
+                for col in range(tile.col, tile.col + tile.width):
+                    cells[row, col] = tile_id
+        self._cell_to_tile_id = cells
+    
+    def _release_all_tile_widgets(self) -> None:
+        """Release every displayed tile widget."""
+        for tile_widget in self.tile_widgets.values():
+            self._release_tile_widget(tile_widget)
+        self.tile_widgets.clear()
+    
+    def _release_tile_widget(self, tile_widget: TileWidget) -> None:
+        """Hide a tile widget and keep it for reuse if the pool has room.
+        
+        Args:
+            tile_widget: Widget no longer showing a tile.
+        """
+        tile_widget.release()
+        if len(self._tile_pool) < self.TILE_POOL_SIZE:
+            self._tile_pool.append(tile_widget)
+        else:
+            tile_widget.deleteLater()
+    
+    def _handle_move_request(self, tile_widget: TileWidget, new_row: int, new_col: int) -> None:
         """Handle tile move request.
         
         Args:
-            tile: The tile to move.
+            tile_widget: Widget of the tile to move.
             new_row: New row position.
             new_col: New column position.
         """
+        tile = tile_widget.tile
         if self.grid_controller.move_tile(tile.id, new_row, new_col):
             # Update tile widget
-            if tile.id in self.tile_widgets:
-                self.tile_widgets[tile.id].update_geometry()
+            tile_widget.update_geometry()
+            self._update_cell_map()
             
-            # Emit signal to save changes
-            self.layout_changed.emit()
-            logger.debug(f"Moved tile {tile.id} to ({new_row}, {new_col})")
+            # Save changes once the drag settles
+            self._save_timer.start()
+            logger.debug("Moved tile %s to (%d, %d)", tile.id, new_row, new_col)
         else:
             # Move failed (collision or out of bounds)
-            logger.debug(f"Move failed for tile {tile.id} to ({new_row}, {new_col})")
+            logger.debug("Move failed for tile %s to (%d, %d)", tile.id, new_row, new_col)
     
-    def _handle_resize_request(self, tile: Tile, new_width: int, new_height: int) -> None:
+    def _handle_resize_request(self, tile_widget: TileWidget, new_width: int, new_height: int) -> None:
         """Handle tile resize request.
         
         Args:
-            tile: The tile to resize.
+            tile_widget: Widget of the tile to resize.
             new_width: New width in grid cells.
             new_height: New height in grid cells.
         """
+        tile = tile_widget.tile
         if self.grid_controller.resize_tile(tile.id, new_width, new_height):
             # Update tile widget
-            if tile.id in self.tile_widgets:
-                self.tile_widgets[tile.id].update_geometry()
+            tile_widget.update_geometry()
+            self._update_cell_map()
             
-            # Emit signal to save changes
-            self.layout_changed.emit()
-            logger.debug(f"Resized tile {tile.id} to {new_width}×{new_height}")
+            # Save changes once the drag settles
+            self._save_timer.start()
+            logger.debug("Resized tile %s to %d×%d", tile.id, new_width, new_height)
         else:
             # Resize failed (collision or invalid size)
-            logger.debug(f"Resize failed for tile {tile.id} to {new_width}×{new_height}")
+            logger.debug("Resize failed for tile %s to %d×%d", tile.id, new_width, new_height)
     
-    def _handle_remove_request(self, tile: Tile) -> None:
+    def _handle_remove_request(self, tile_widget: TileWidget) -> None:
         """Handle tile removal request.
         
         Args:
-            tile: The tile to remove.
+            tile_widget: Widget of the tile to remove.
         """
+        tile = tile_widget.tile
         reply = QMessageBox.question(
             self,
             "Remove Tile",
@@ -264,21 +419,21 @@ class GridView(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Destroy plugin instance
-            if hasattr(self.parent(), 'plugin_loader'):
-                self.parent().plugin_loader.destroy_instance(tile.instance_id)
+            # Dispose plugin instance
+            if self._plugin_loader is not None:
+                self._plugin_loader.dispose_instance(tile.instance_id)
             
             # Delete from database
-            if hasattr(self.parent(), 'repository') and tile.id is not None:
-                self.parent().repository.delete_tile(tile.id)
+            if self._repository is not None and tile.id is not None:
+                self._repository.delete_tile(tile.id)
             
             # Remove from grid controller
             self.grid_controller.remove_tile(tile.id)
             
             # Remove widget
             if tile.id in self.tile_widgets:
-                self.tile_widgets[tile.id].deleteLater()
-                del self.tile_widgets[tile.id]
+                self._release_tile_widget(self.tile_widgets.pop(tile.id))
+                self._update_cell_map()
             
             # Emit signal (for any additional cleanup)
             self.layout_changed.emit()
@@ -291,25 +446,52 @@ class GridView(QWidget):
         if not self.edit_mode:
             return
         
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw grid lines
-        pen = QPen(QColor(200, 200, 200))
-        pen.setStyle(Qt.PenStyle.DashLine)
-        painter.setPen(pen)
+        if self._grid_overlay is None:
+            self._grid_overlay = self._render_grid_overlay()
         
-        # Vertical lines
-        for col in range(self.GRID_COLS + 1):
-            x = col * self.cell_size
-            painter.drawLine(x, 0, x, self.height())
+        # Blit only the part of the overlay Qt asked to repaint; the source
+        # rectangle is in device pixels
+        target = QRectF(event.rect())
+        ratio = self._grid_overlay.devicePixelRatio()
+        source = QRectF(
+            target.x() * ratio, target.y() * ratio,
+            target.width() * ratio, target.height() * ratio
+        )
         
-        # Horizontal lines
-        for row in range(self.GRID_ROWS + 1):
-            y = row * self.cell_size
-            painter.drawLine(0, y, self.width(), y)
+        painter = QPainter(self)
+        painter.drawPixmap(target, self._grid_overlay, source)
+        painter.end()
+    
+    def _render_grid_overlay(self) -> QPixmap:
+        """Render the grid lines into a transparent pixmap the size of the view.
         
+        Returns:
+            Pixmap holding the grid lines.
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        width = self.width()
+        height = self.height()
+        
+        # Vertical lines, then horizontal lines
+        lines = [
+            QLineF(col * self.cell_size, 0, col * self.cell_size, height)
+            for col in range(self.GRID_COLS + 1)
+        ] + [
+            QLineF(0, row * self.cell_size, width, row * self.cell_size)
+            for row in range(self.GRID_ROWS + 1)
+        ]
+        
+        # Axis-aligned 1px lines gain nothing from antialiasing
+        painter = QPainter(pixmap)
+        painter.setPen(self._grid_pen)
+        painter.drawLines(lines)
         painter.end()
+        
+        return pixmap
     
     def contextMenuEvent(self, event) -> None:
         """Handle right-click context menu.
@@ -320,20 +502,16 @@ class GridView(QWidget):
         if not self.edit_mode:
             return
         
-        # Find which tile was clicked
+        # Find which tile was clicked from the grid cell under the cursor
         pos = event.pos()
-        clicked_tile = None
-        
-        for tile_id, tile_widget in self.tile_widgets.items():
-            if tile_widget.geometry().contains(pos):
-                clicked_tile = tile_widget.tile
-                break
+        cell = (pos.y() // self.cell_size, pos.x() // self.cell_size)
+        tile_id = self._cell_to_tile_id.get(cell)
         
-        if not clicked_tile:
+        if tile_id is None:
             return
         
         # Show settings dialog
-        self._show_tile_settings(clicked_tile)
+        self._show_tile_settings(self.tile_widgets[tile_id].tile)
     
     def _show_tile_settings(self, tile: Tile) -> None:
         """Show settings dialog for a tile.
@@ -343,8 +521,8 @@ class GridView(QWidget):
         """
         # Get plugin metadata
         metadata = None
-        if hasattr(self.parent(), 'plugin_loader'):
-            metadata = self.parent().plugin_loader.get_metadata(tile.plugin_id)
+        if self._plugin_loader is not None:
+            metadata = self._plugin_loader.get_metadata(tile.plugin_id)
         
         if not metadata or not metadata.schema_path:
             QMessageBox.information(
@@ -354,33 +532,68 @@ class GridView(QWidget):
             )
             return
         
+        schema = self._get_settings_schema(tile.plugin_id, metadata.schema_path)
+        if schema is None:
+            QMessageBox.warning(
+                self,
+                "Settings Unavailable",
+                f"The settings schema for '{tile.plugin_id}' could not be loaded."
+            )
+            return
+        
+        # Imported on first use; it pulls in the schema validator
+        from ui.settings_dialog import SettingsDialog
+        
         # Show settings dialog
         dialog = SettingsDialog(
+            schema=schema,
+            current_settings=tile.state,
             title=f"{metadata.name} Settings",
-            schema_path=metadata.schema_path,
-            current_values=tile.state,
             parent=self
         )
         
         if dialog.exec():
-            new_settings = dialog.get_values()
+            new_settings = dialog.get_settings()
             
             # Update tile state
             tile.state = new_settings
             
             # Update plugin instance
-            if hasattr(self.parent(), 'plugin_loader'):
-                self.parent().plugin_loader.update_instance(
-                    tile.instance_id,
-                    new_settings
-                )
+            plugin = self._get_plugin(tile)
+            if plugin is not None:
+                plugin.on_settings_changed(new_settings)
             
             # Save to database
-            if hasattr(self.parent(), 'repository'):
-                self.parent().repository.update_tile(tile)
+            if self._repository is not None and tile.id is not None:
+                self._repository.update_tile(tile.id, tile.to_dict())
             
             logger.info(f"Updated settings for tile {tile.id}")
     
+    def _get_settings_schema(self, plugin_id: str, schema_path: str) -> Optional[Dict[str, Any]]:
+        """Get the settings schema for a plugin, loading it on first use.
+        
+        Args:
+            plugin_id: Plugin identifier.
+            schema_path: Path to the plugin's schema file.
+        
+        Returns:
+            Parsed schema dictionary, or None if it could not be loaded.
+        """
+        schema = self._settings_schemas.get(plugin_id)
+        if schema is not None:
+            return schema
+        
+        from core.schema_loader import SchemaLoader
+        
+        try:
+            schema = SchemaLoader().load_schema(Path(schema_path))
+        except Exception as e:
+            logger.error("Failed to load settings schema for %s: %s", plugin_id, e)
+            return None
+        
+        self._settings_schemas[plugin_id] = schema
+        return schema
+    
     def sizeHint(self) -> QSize:
         """Get the recommended size for the grid.
         
@@ -4,29 +4,113 @@ import logging
 import uuid
 import json
 from pathlib import Path
+from typing import Dict, List, Tuple
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QLabel,
-    QMenuBar, QMenu, QMessageBox, QInputDialog, QScrollArea, QFileDialog
+    QMenuBar, QMenu, QMessageBox, QScrollArea, QStackedWidget
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QAction, QKeySequence
 
 from core.config import Config
 from core.models import Page, Tile
 from core.grid_controller import GridController
-from core.schema_loader import SchemaLoader
 from core.plugin_loader import PluginLoader
 from storage.repository import StorageRepository
 from storage.import_export import LayoutImportExport
 from ui.theme_manager import ThemeManager
 from ui.grid_view import GridView
 from ui.page_manager import PageManager
-from ui.settings_dialog import SettingsDialog
-from ui.app_settings_dialog import AppSettingsDialog
 
 logger = logging.getLogger(__name__)
 
 
+def _read_layout(repository: StorageRepository) -> Tuple[List[Page], Dict[int, List[Tile]]]:
+    """Read every page and its tiles with a single query.
+    
+    Args:
+        repository: Storage repository.
+    
+    Returns:
+        Tuple of (pages in display order, tiles by page ID).
+    """
+    pages: List[Page] = []
+    tiles_by_page: Dict[int, List[Tile]] = {}
+    
+    for row in repository.iter_all_tiles_with_page():
+        page_id = row['page_id']
+        if page_id not in tiles_by_page:
+            pages.append(Page(id=page_id, name=row['page_name'], index_order=row['index_order']))
+            tiles_by_page[page_id] = []
+        
+        # Pages without tiles come back as a single row with no tile
+        if row['id'] is None:
+            continue
+        
+        state_json = row['state_json']
+        try:
+            state = json.loads(state_json) if state_json else {}
+        except json.JSONDecodeError:
+            state = {}
+        
+        tiles_by_page[page_id].append(Tile(
+            id=row['id'],
+            page_id=page_id,
+            plugin_id=row['plugin_id'],
+            instance_id=row['instance_id'],
+            row=row['row'],
+            col=row['col'],
+            width=row['width'],
+            height=row['height'],
+            z_index=row['z_index'] or 0,
+            state=state if state is not None else {}
+        ))
+    
+    return pages, tiles_by_page
+
+
+class _LayoutLoaderSignals(QObject):
+    """Signals of _LayoutLoader; a QRunnable cannot emit signals itself."""
+    
+    loaded = Signal(int, object, object)  # generation, pages, tiles by page ID
+    failed = Signal(int, str)  # generation, error message
+
+
+class _LayoutLoader(QRunnable):
+    """Reads the saved layout on a pool thread and reports it through signals."""
+    
+    def __init__(self, repository: StorageRepository, generation: int) -> None:
+        """Initialize the loader.
+        
+        Args:
+            repository: Storage repository to read from.
+            generation: Load request number, passed back with the result.
+        """
+        super().__init__()
+        self.repository = repository
+        self.generation = generation
+        self.signals = _LayoutLoaderSignals()
+    
+    def run(self) -> None:
+        """Read the layout and emit loaded, or failed on error.
+        
+        Reads through a connection of its own, since the UI thread may
+        write through the repository's connection meanwhile.
+        """
+        try:
+            reader = self.repository.open_reader()
+            try:
+                pages, tiles_by_page = _read_layout(reader)
+            finally:
+                reader.close()
+        except Exception as e:
+            logger.error("Error loading layout: %s", e, exc_info=True)
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        
+        self.signals.loaded.emit(self.generation, pages, tiles_by_page)
+
+
 class MainWindow(QMainWindow):
     """Main application window with menu bar and grid view."""
     
@@ -44,31 +128,56 @@ class MainWindow(QMainWindow):
         self.theme_manager = ThemeManager()
         self.grid_controller = GridController()
         self.import_export = LayoutImportExport(repository)
-        self.schema_loader = SchemaLoader()
         self.plugin_loader = PluginLoader()
         
         # State
         self.is_edit_mode = False
         self.grid_view = None
         self.page_manager = None
+        self._content_built = False
+        
+        # Latest layout load request; older results are ignored
+        self._layout_generation = 0
+        self._layout_loader = None
         
         # Discover plugins
         self.plugin_loader.discover_plugins()
         logger.info(f"Discovered {len(self.plugin_loader.get_all_metadata())} plugins")
         
-        # Setup UI
+        # Setup UI; the pages and grid are built once the window is shown
         self._setup_ui()
         self._create_menus()
         self._apply_initial_theme()
-        self._load_initial_data()
         
         logger.info("Main window initialized")
     
     def _setup_ui(self) -> None:
-        """Set up the main window UI."""
+        """Set up the window shell with a loading placeholder."""
         self.setWindowTitle("WidgetBoard")
         self.resize(self.config.window_width, self.config.window_height)
         
+        self._central_stack = QStackedWidget()
+        loading_label = QLabel("Loading…")
+        loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._central_stack.addWidget(loading_label)
+        
+        self.setCentralWidget(self._central_stack)
+    
+    def showEvent(self, event) -> None:
+        """Build the content after the first show so the shell paints first."""
+        super().showEvent(event)
+        
+        if not self._content_built:
+            self._content_built = True
+            QTimer.singleShot(0, self._finish_startup)
+    
+    def _finish_startup(self) -> None:
+        """Build the page manager and grid, then load the saved layout."""
+        self._setup_content()
+        self._load_initial_data()
+    
+    def _setup_content(self) -> None:
+        """Create the page manager and grid view and show them."""
         # Create central widget
         central_widget = QWidget()
         layout = QVBoxLayout(central_widget)
@@ -87,13 +196,22 @@ class MainWindow(QMainWindow):
         scroll_area.setWidgetResizable(False)
         scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        self.grid_view = GridView(self.grid_controller, self)
+        self.grid_view = GridView(
+            self.grid_controller,
+            self,
+            plugin_loader=self.plugin_loader,
+            repository=self.repository
+        )
         self.grid_view.layout_changed.connect(self._on_layout_changed)
         scroll_area.setWidget(self.grid_view)
         
         layout.addWidget(scroll_area, 1)
         
-        self.setCentralWidget(central_widget)
+        self._central_stack.addWidget(central_widget)
+        self._central_stack.setCurrentWidget(central_widget)
+        
+        # Edit mode may have been toggled before the grid existed
+        self.grid_view.set_edit_mode(self.is_edit_mode)
     
     def _create_menus(self) -> None:
         """Create application menu bar."""
@@ -161,110 +279,98 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self._on_about)
     
     def _create_plugin_menu(self) -> None:
-        """Create the Plugins menu with discovered plugins."""
-        # Remove old plugin menu if exists
-        menubar = self.menuBar()
-        for action in menubar.actions():
-            if action.text() == "&Plugins":
-                menubar.removeAction(action)
-                break
+        """Create the Plugins menu.
+        
+        Only the Reload action is created here, so its shortcut works
+        from the start; the per-plugin entries are added when the menu
+        is first shown and again after a reload.
+        """
+        self.plugin_menu = self.menuBar().addMenu("&Plugins")
+        self.plugin_menu.aboutToShow.connect(self._populate_plugin_menu)
+        self._plugin_actions: List[QAction] = []
+        self._plugin_menu_stale = True
+        
+        self._plugin_menu_separator = self.plugin_menu.addSeparator()
         
-        plugin_menu = menubar.addMenu("&Plugins")
+        # Reload plugins action
+        reload_action = self.plugin_menu.addAction("Reload Plugins")
+        reload_action.setShortcut("Ctrl+R")
+        reload_action.triggered.connect(self._reload_plugins)
+    
+    def _populate_plugin_menu(self) -> None:
+        """Add an entry per discovered plugin to the Plugins menu if it is stale."""
+        if not self._plugin_menu_stale:
+            return
+        
+        for action in self._plugin_actions:
+            self.plugin_menu.removeAction(action)
+            action.deleteLater()
+        self._plugin_actions = []
         
         # Get all discovered plugins
         plugins = self.plugin_loader.get_all_metadata()
         
         if not plugins:
-            no_plugins_action = plugin_menu.addAction("No plugins found")
+            no_plugins_action = QAction("No plugins found", self.plugin_menu)
             no_plugins_action.setEnabled(False)
-            return
+            self._plugin_actions.append(no_plugins_action)
         
         # Add action for each plugin
         for metadata in plugins:
-            action = plugin_menu.addAction(f"Add {metadata.name}")
+            action = QAction(f"Add {metadata.name}", self.plugin_menu)
             action.setToolTip(metadata.description)
             # Connect to add_plugin_tile with the plugin_id
             action.triggered.connect(
                 lambda checked=False, pid=metadata.plugin_id: self._add_plugin_tile(pid)
             )
+            self._plugin_actions.append(action)
         
-        plugin_menu.addSeparator()
-        
-        # Reload plugins action
-        reload_action = plugin_menu.addAction("Reload Plugins")
-        reload_action.setShortcut("Ctrl+R")
-        reload_action.triggered.connect(self._reload_plugins)
+        self.plugin_menu.insertActions(self._plugin_menu_separator, self._plugin_actions)
+        self._plugin_menu_stale = False
     
     def _apply_initial_theme(self) -> None:
         """Apply the initial theme from config."""
         self.theme_manager.apply_theme(self.config.theme)
     
     def _load_initial_data(self) -> None:
-        """Load initial pages and tiles from database."""
-        # Load pages
-        pages_data = self.repository.get_all_pages()
-        
-        # Convert dict results to Page objects if needed
-        pages = []
-        for page_data in pages_data:
-            if isinstance(page_data, dict):
-                # Convert dict to Page object
-                page = Page(
-                    id=page_data['id'],
-                    name=page_data['name'],
-                    index_order=page_data['index_order']
-                )
-            else:
-                # Already a Page object
-                page = page_data
-            pages.append(page)
+        """Load pages and tiles from the database on a pool thread.
+        
+        The result is applied by _apply_layout() on the UI thread.
+        """
+        self._layout_generation += 1
+        loader = _LayoutLoader(self.repository, self._layout_generation)
+        loader.signals.loaded.connect(self._apply_layout)
+        loader.signals.failed.connect(self._on_layout_load_failed)
+        
+        # Keep the signals object alive until the result arrives
+        self._layout_loader = loader
+        QThreadPool.globalInstance().start(loader)
+    
+    def _apply_layout(self, generation: int, pages: List[Page], tiles_by_page: Dict[int, List[Tile]]) -> None:
+        """Show a layout read by _load_initial_data().
+        
+        Args:
+            generation: Load request the layout belongs to.
+            pages: Pages in display order.
+            tiles_by_page: Tiles by page ID.
+        """
+        if generation != self._layout_generation:
+            return
+        self._layout_loader = None
         
         if not pages:
             # Create default page
             page_id = self.repository.create_page("Dashboard", 0)
             default_page = Page(id=page_id, name="Dashboard", index_order=0)
             pages = [default_page]
+            tiles_by_page = {page_id: []}
             logger.info("Created default page")
         
         # Set pages in grid controller
         self.grid_controller.pages = pages
         
-        # Load tiles for all pages
         for page in pages:
-            tiles_data = self.repository.get_tiles_for_page(page.id)
-            
-            # Convert dict results to Tile objects if needed
-            tiles = []
-            for tile_data in tiles_data:
-                if isinstance(tile_data, dict):
-                    # Handle state field - might be JSON string
-                    state = tile_data.get('state', {})
-                    if isinstance(state, str):
-                        try:
-                            state = json.loads(state)
-                        except json.JSONDecodeError:
-                            state = {}
-                    elif state is None:
-                        state = {}
-                    
-                    # Convert dict to Tile object
-                    tile = Tile(
-                        id=tile_data['id'],
-                        page_id=tile_data['page_id'],
-                        plugin_id=tile_data['plugin_id'],
-                        instance_id=tile_data['instance_id'],
-                        row=tile_data['row'],
-                        col=tile_data['col'],
-                        width=tile_data['width'],
-                        height=tile_data['height'],
-                        z_index=tile_data.get('z_index', 0),
-                        state=state
-                    )
-                else:
-                    # Already a Tile object
-                    tile = tile_data
-                tiles.append(tile)
-            
+            tiles = tiles_by_page[page.id]
             self.grid_controller.tiles_by_page[page.id] = tiles
             
             # Create plugin instances for tiles
@@ -274,11 +380,27 @@ class MainWindow(QMainWindow):
             logger.info(f"Loaded {len(tiles)} tiles for page '{page.name}'")
         
         # Switch to first page
-        if pages:
-            self.grid_controller.switch_to_page(pages[0].id)
-            # Set pages in page manager - this will automatically trigger page_changed signal
-            self.page_manager.set_pages(pages)
-            self.grid_view.refresh()
+        self.grid_controller.switch_to_page(pages[0].id)
+        # Set pages in page manager - this will automatically trigger page_changed signal
+        self.page_manager.set_pages(pages)
+        self.grid_view.refresh()
+    
+    def _on_layout_load_failed(self, generation: int, message: str) -> None:
+        """Report a layout that could not be read.
+        
+        Args:
+            generation: Load request that failed.
+            message: Error message.
+        """
+        if generation != self._layout_generation:
+            return
+        self._layout_loader = None
+        
+        QMessageBox.critical(
+            self,
+            "Load Failed",
+            f"Failed to load the saved layout:\n\n{message}"
+        )
     
     def _ensure_plugin_instance(self, tile: Tile) -> None:
         """Ensure a plugin instance exists for a tile.
@@ -453,8 +575,12 @@ class MainWindow(QMainWindow):
             f"Discovered {len(plugins)} plugins"
         )
         
-        # Rebuild plugin menu
-        self._create_plugin_menu()
+        # Rebuild the plugin entries the next time the menu opens
+        self._plugin_menu_stale = True
+        
+        # Schemas may have changed on disk
+        if self.grid_view:
+            self.grid_view.clear_plugin_caches()
         
         logger.info(f"Reloaded plugins: {len(plugins)} found")
     
@@ -483,6 +609,9 @@ class MainWindow(QMainWindow):
         Args:
             page: The new current page.
         """
+        # Saves apply to the current page, so write the old page's changes first
+        self._save_pending_layout()
+        
         # Stop plugins on old page
         if self.grid_controller.current_page:
             old_tiles = self.grid_controller.tiles_by_page.get(
@@ -505,6 +634,8 @@ class MainWindow(QMainWindow):
     
     def _on_new_page(self) -> None:
         """Handle new page request."""
+        from PySide6.QtWidgets import QInputDialog
+        
         name, ok = QInputDialog.getText(
             self,
             "New Page",
@@ -550,7 +681,7 @@ class MainWindow(QMainWindow):
         # Stop and dispose plugins on this page
         tiles = self.grid_controller.tiles_by_page.get(page.id, [])
         for tile in tiles:
-            self.plugin_loader.destroy_instance(tile.instance_id)
+            self.plugin_loader.dispose_instance(tile.instance_id)
         
         # Delete from database (this also deletes associated tiles via CASCADE)
         try:
@@ -568,6 +699,11 @@ class MainWindow(QMainWindow):
         
         logger.info(f"Removed page: {page.name}")
     
+    def _save_pending_layout(self) -> None:
+        """Save now if the grid view is still holding back a layout change."""
+        if self.grid_view:
+            self.grid_view.flush_layout_changes()
+    
     def _on_layout_changed(self) -> None:
         """Handle layout change event - save tiles to database."""
         logger.debug("Layout changed, saving to database")
@@ -613,6 +749,11 @@ class MainWindow(QMainWindow):
     
     def _on_import_layout(self) -> None:
         """Handle import layout action."""
+        from PySide6.QtWidgets import QFileDialog
+        
+        # Write pending changes before the import replaces or merges them
+        self._save_pending_layout()
+        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Import Layout",
@@ -669,6 +810,8 @@ class MainWindow(QMainWindow):
     
     def _on_export_layout(self) -> None:
         """Handle export layout action."""
+        from PySide6.QtWidgets import QFileDialog
+        
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Layout",
@@ -700,6 +843,9 @@ class MainWindow(QMainWindow):
     
     def _on_settings(self) -> None:
         """Handle settings action."""
+        # Imported on first use to keep dialog code out of startup
+        from ui.app_settings_dialog import AppSettingsDialog
+        
         dialog = AppSettingsDialog(self.config, self)
         if dialog.exec():
             # Apply theme if changed
@@ -729,6 +875,9 @@ class MainWindow(QMainWindow):
         """Handle window close event."""
         logger.info("Main window closing")
         
+        # Don't lose a save that is still waiting out its delay
+        self._save_pending_layout()
+        
         # Stop all plugin instances
         if hasattr(self, 'plugin_loader'):
             for instance_id in list(self.plugin_loader._instances.keys()):
@@ -8,6 +8,7 @@ from PySide6.QtGui import QPainter, QColor, QPen, QFont
 
 from core.models import Tile
 from core.plugin_api import WidgetPlugin  # Changed from PluginBase to WidgetPlugin
+from core.plugin_proxy import PluginProxy
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,10 @@ class TileWidget(QWidget):
     RESIZE_HANDLE_SIZE = 12
     BORDER_WIDTH = 2
     
+    # Resize handle colors, shared by all tiles instead of built per paint
+    _HANDLE_COLOR = QColor("#2196F3")
+    _GRIP_PEN = QPen(QColor("white"), 2)
+    
     def __init__(
         self,
         tile: Tile,
@@ -51,17 +56,24 @@ class TileWidget(QWidget):
         self.start_geometry = QRect()
         self.content_widget = None
         
+        # True while a placeholder waits for the plugin's first render
+        self._awaiting_render = False
+        
+        # (row, col, width, height) the geometry was last set from
+        self.geometry_key = None
+        
         # Update timer for plugins that need periodic updates
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self._on_update_timer)
         self.last_update_time = 0
         
-        self._setup_ui()
-        self.update_geometry()
-        
-        # Connect to plugin signals if available
+        # Connect to plugin signals if available; before building the
+        # content, which may start a fetch that reports through the signal
         if self.plugin:
             self.plugin.render_updated.connect(self._refresh_content)
+        
+        self._setup_ui()
+        self.update_geometry()
     
     def _setup_ui(self) -> None:
         """Set up the widget UI."""
@@ -79,7 +91,7 @@ class TileWidget(QWidget):
         # Apply initial style
         self._update_style()
     
-    def _create_content_widget(self, layout: QVBoxLayout) -> None:
+    def _create_content_widget(self, layout: QVBoxLayout, fetch_async: bool = True) -> None:
         """Create the content widget based on plugin availability.
         print(f"DEBUG: Creating content for tile {self.tile.instance_id}")
         print(f"  Plugin: {self.plugin}")
@@ -87,7 +99,19 @@ class TileWidget(QWidget):
         
         Args:
             layout: The layout to add content to
+            fetch_async: Fetch a missing first render in the background
         """
+        self._awaiting_render = False
+        
+        # Out-of-process plugins without a render yet are fetched in the
+        # background; _refresh_content() rebuilds once the data arrives
+        if (fetch_async and isinstance(self.plugin, PluginProxy)
+                and not self.plugin.has_render_data()):
+            self._awaiting_render = True
+            self.plugin.fetch_render_data_async()
+            self._create_placeholder_content(layout)
+            return
+        
         # Check if we have a plugin to render
         if self.plugin:
             print(f"  Plugin state: {self.plugin.state}")
@@ -171,6 +195,12 @@ class TileWidget(QWidget):
     
     def _refresh_content(self) -> None:
         """Refresh the content from the plugin."""
+        if self._awaiting_render:
+            # If the fetch failed, fall back to a blocking request once
+            # rather than starting another background fetch
+            self._rebuild_content(fetch_async=False)
+            return
+        
         if not self.plugin or not self.content_widget:
             return
         
@@ -207,6 +237,57 @@ class TileWidget(QWidget):
         self._create_content_widget(layout)
         self._update_style()
     
+    def release(self) -> None:
+        """Hide the widget and detach it from its plugin so it can be pooled."""
+        self.hide()
+        self.update_timer.stop()
+        
+        if self.plugin:
+            try:
+                self.plugin.render_updated.disconnect(self._refresh_content)
+            except (RuntimeError, TypeError):
+                pass
+            self.plugin = None
+    
+    def rebind(self, tile: Tile, cell_size: int, plugin: Optional[WidgetPlugin] = None) -> None:
+        """Reuse this widget for another tile.
+        
+        The layout and signal connections are kept; only the content
+        is rebuilt. Call release() first.
+        
+        Args:
+            tile: The tile data model
+            cell_size: Size of one grid cell in pixels
+            plugin: Optional plugin instance to render in the tile
+        """
+        self.tile = tile
+        self.cell_size = cell_size
+        self.plugin = plugin
+        self.is_dragging = False
+        self.is_resizing = False
+        self.last_update_time = 0
+        
+        if self.plugin:
+            self.plugin.render_updated.connect(self._refresh_content)
+        
+        self._rebuild_content()
+        self.update_geometry()
+    
+    def _rebuild_content(self, fetch_async: bool = True) -> None:
+        """Replace the content widgets, keeping the layout itself.
+        
+        Args:
+            fetch_async: Fetch a missing first render in the background
+        """
+        layout = self.layout()
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        self.content_widget = None
+        
+        self._create_content_widget(layout, fetch_async)
+    
     def _clear_layout(self) -> None:
         """Clear all widgets from the layout."""
         # Stop update timer
@@ -228,6 +309,10 @@ class TileWidget(QWidget):
         Args:
             enabled: True to enable edit mode
         """
+        # Restyling re-parses the style sheet, so skip it when nothing changes
+        if enabled == self.is_edit_mode:
+            return
+        
         self.is_edit_mode = enabled
         self._update_style()
         self.update()
@@ -240,6 +325,7 @@ class TileWidget(QWidget):
         height = self.tile.height * self.cell_size
         
         self.setGeometry(x, y, width, height)
+        self.geometry_key = (self.tile.row, self.tile.col, self.tile.width, self.tile.height)
     
     def _update_style(self) -> None:
         """Update widget styling based on state."""
@@ -274,10 +360,10 @@ class TileWidget(QWidget):
             
             # Resize handle
             handle_rect = self._get_resize_handle_rect()
-            painter.fillRect(handle_rect, QColor("#2196F3"))
+            painter.fillRect(handle_rect, self._HANDLE_COLOR)
             
             # Draw grip lines
-            painter.setPen(QPen(QColor("white"), 2))
+            painter.setPen(self._GRIP_PEN)
             grip_offset = 3
             painter.drawLine(
                 handle_rect.right() - grip_offset,